@@ -26,26 +26,46 @@ from random import choice, randint, shuffle
 import re
 from pathlib import Path
 import importlib
+import importlib.util
 import inspect
-
-# Import aliasing
-import numpy as np  # Standard alias (if available)
-import pandas as pd  # Standard alias (if available)
-import matplotlib.pyplot as plt  # Standard alias (if available)
-
-# Try/except imports for optional dependencies
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+import functools
+import io
+import contextlib
+
+# Availability probes for optional dependencies.
+# find_spec() only locates the module; it does not execute it, so checking
+# for a heavy package costs nothing until the package is actually used.
+REQUESTS_AVAILABLE = importlib.util.find_spec("requests") is not None
+SQLITE_AVAILABLE = importlib.util.find_spec("sqlite3") is not None
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+
+if not REQUESTS_AVAILABLE:
     print("requests library not available")
 
-try:
-    import sqlite3
-    SQLITE_AVAILABLE = True
-except ImportError:
-    SQLITE_AVAILABLE = False
+# Section banner, built once instead of on every demo call
+_BANNER = "=" * 60
+
+
+def _header(title):
+    """Return a section header as one string so it prints in a single call"""
+    return f"\n{_BANNER}\n{title}\n{_BANNER}"
+
+
+def _buffered(func):
+    """Collect a demo's print() output in memory and write it out once"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            # Flush whatever was printed, even if the demo raised
+            sys.stdout.write(buffer.getvalue())
+    return wrapper
+
 
 # Conditional imports based on Python version
 import sys
@@ -62,11 +82,10 @@ else:
         TYPING_EXTENSIONS_NEEDED = True
 
 
+@_buffered
 def demonstrate_builtin_imports():
     """Demonstrate importing and using built-in modules"""
-    print("=" * 60)
-    print("BUILT-IN MODULE IMPORTS")
-    print("=" * 60)
+    print(_header("BUILT-IN MODULE IMPORTS"))
 
     print("\n1. OS Module (Operating System Interface):")
     print(f"Current working directory: {os.getcwd()}")
@@ -124,11 +143,10 @@ def demonstrate_builtin_imports():
     print(f"File exists: {current_file.exists()}")
 
 
+@_buffered
 def demonstrate_import_variations():
     """Demonstrate different import syntaxes and their uses"""
-    print("\n" + "=" * 60)
-    print("IMPORT SYNTAX VARIATIONS")
-    print("=" * 60)
+    print(_header("IMPORT SYNTAX VARIATIONS"))
 
     print("\n1. Basic Import:")
     print("   import math")
@@ -154,8 +172,10 @@ def demonstrate_import_variations():
     # Note: We already did this above, so functions like choice() are available
 
     print("\n6. Multiple Imports:")
-    print("   from collections import defaultdict, Counter, namedtuple")
-    from collections import defaultdict, Counter, namedtuple
+    print("   from collections import defaultdict, Counter")
+    print("   from dataclasses import dataclass")
+    from collections import defaultdict, Counter
+    from dataclasses import dataclass
 
     # Demonstrate usage
     dd = defaultdict(int)
@@ -165,20 +185,25 @@ def demonstrate_import_variations():
     counter = Counter(['a', 'b', 'a', 'c', 'b', 'a'])
     print(f"   Counter example: {counter}")
 
-    Point = namedtuple('Point', ['x', 'y'])
+    # A frozen, slotted dataclass avoids namedtuple's exec() of generated source
+    @dataclass(frozen=True, slots=True)
+    class Point:
+        x: int
+        y: int
+
     p = Point(3, 4)
-    print(f"   namedtuple example: {p}, distance from origin: {(p.x**2 + p.y**2)**0.5}")
+    print(f"   dataclass example: {p}, distance from origin: {(p.x**2 + p.y**2)**0.5}")
 
 
+@_buffered
 def demonstrate_third_party_imports():
     """Demonstrate third-party package imports"""
-    print("\n" + "=" * 60)
-    print("THIRD-PARTY PACKAGE IMPORTS")
-    print("=" * 60)
+    print(_header("THIRD-PARTY PACKAGE IMPORTS"))
 
     print("\n1. Requests Library (HTTP):")
     if REQUESTS_AVAILABLE:
         print("   import requests")
+        import requests  # Loaded only when this demo actually runs
         print("   ✅ requests is available")
 
         # Example usage (commented out to avoid actual network calls)
@@ -189,42 +214,43 @@ def demonstrate_third_party_imports():
         print("   Install with: pip install requests")
 
     print("\n2. NumPy (Numerical Computing):")
-    try:
+    if NUMPY_AVAILABLE:
         print("   import numpy as np")
+        import numpy as np
         array = np.array([1, 2, 3, 4, 5])
         print(f"   ✅ NumPy array: {array}")
         print(f"   Array sum: {np.sum(array)}")
-    except ImportError:
+    else:
         print("   ❌ NumPy not available")
         print("   Install with: pip install numpy")
 
     print("\n3. Pandas (Data Analysis):")
-    try:
+    if PANDAS_AVAILABLE:
         print("   import pandas as pd")
+        import pandas as pd
         df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]})
         print("   ✅ Pandas DataFrame:")
         print(f"   {df}")
-    except ImportError:
+    else:
         print("   ❌ Pandas not available")
         print("   Install with: pip install pandas")
 
     print("\n4. Matplotlib (Plotting):")
-    try:
+    if MATPLOTLIB_AVAILABLE:
         print("   import matplotlib.pyplot as plt")
         print("   ✅ Matplotlib available")
         # Example (without actually displaying plot)
         print("   # plt.plot([1, 2, 3, 4], [1, 4, 2, 3])")
         print("   # plt.show()")
-    except ImportError:
+    else:
         print("   ❌ Matplotlib not available")
         print("   Install with: pip install matplotlib")
 
 
+@_buffered
 def demonstrate_local_imports():
     """Demonstrate importing local modules and packages"""
-    print("\n" + "=" * 60)
-    print("LOCAL MODULE AND PACKAGE IMPORTS")
-    print("=" * 60)
+    print(_header("LOCAL MODULE AND PACKAGE IMPORTS"))
 
     print("\n1. Importing from same directory:")
     print("   # If you have a file 'utils.py' in the same directory:")
@@ -258,21 +284,23 @@ def demonstrate_local_imports():
 
     # Demonstrate current Python path
     print(f"\n5. Current Python path (first 3 entries):")
-    for i, path in enumerate(sys.path[:3]):
-        print(f"   {i}: {path}")
+    print("\n".join(f"   {i}: {path}" for i, path in enumerate(sys.path[:3])))
 
 
+@_buffered
 def demonstrate_dynamic_imports():
     """Demonstrate dynamic imports using importlib"""
-    print("\n" + "=" * 60)
-    print("DYNAMIC IMPORTS")
-    print("=" * 60)
+    print(_header("DYNAMIC IMPORTS"))
+
+    # Bind hot globals to locals once: LOAD_FAST instead of LOAD_GLOBAL + LOAD_ATTR
+    import_module = importlib.import_module
+    modules = sys.modules
 
     print("\n1. Dynamic import with importlib:")
 
     # Dynamic import of a built-in module
     module_name = "math"
-    math_module = importlib.import_module(module_name)
+    math_module = import_module(module_name)
     print(f"   Dynamically imported {module_name}")
     print(f"   math_module.sqrt(16) = {math_module.sqrt(16)}")
 
@@ -286,7 +314,7 @@ def demonstrate_dynamic_imports():
     print("\n3. Checking if module is available:")
     def try_import(module_name):
         try:
-            module = importlib.import_module(module_name)
+            module = import_module(module_name)
             print(f"   ✅ {module_name} is available")
             return module
         except ImportError:
@@ -302,7 +330,9 @@ def demonstrate_dynamic_imports():
 
     for name in module_names:
         try:
-            loaded_modules[name] = importlib.import_module(name)
+            # Already-imported modules are a plain dict hit in sys.modules
+            module = modules.get(name)
+            loaded_modules[name] = module if module is not None else import_module(name)
             print(f"   ✅ Loaded {name}")
         except ImportError:
             print(f"   ❌ Failed to load {name}")
@@ -314,11 +344,16 @@ def demonstrate_dynamic_imports():
         print(f"   JSON dumps: {json_module.dumps(data)}")
 
 
+@functools.lru_cache(maxsize=None)
+def _signature(func):
+    """Return inspect.signature(func), cached since signature parsing is slow"""
+    return inspect.signature(func)
+
+
+@_buffered
 def demonstrate_import_inspection():
     """Demonstrate introspection of imported modules"""
-    print("\n" + "=" * 60)
-    print("MODULE INSPECTION AND INTROSPECTION")
-    print("=" * 60)
+    print(_header("MODULE INSPECTION AND INTROSPECTION"))
 
     print("\n1. Module attributes:")
     print(f"   math module file: {math.__file__ if hasattr(math, '__file__') else 'Built-in'}")
@@ -326,84 +361,89 @@ def demonstrate_import_inspection():
     print(f"   math module doc: {math.__doc__[:50]}...")
 
     print("\n2. Available functions in a module:")
-    math_functions = [name for name in dir(math) if not name.startswith('_')]
+    # Iterating the module's __dict__ skips dir()'s sort and attribute merge
+    math_functions = [name for name in math.__dict__ if not name.startswith('_')]
     print(f"   Math functions: {math_functions[:10]}...")  # First 10
 
     print("\n3. Function signatures:")
     for func_name in ["sqrt", "sin", "cos"][:3]:
         func = getattr(math, func_name)
-        sig = inspect.signature(func)
+        sig = _signature(func)
         print(f"   math.{func_name}{sig}")
 
     print("\n4. Module inspection with inspect:")
     print(f"   Is math a module? {inspect.ismodule(math)}")
     print(f"   Is math.sqrt a function? {inspect.isfunction(math.sqrt)}")
 
-    # Get all functions from a module
-    functions = inspect.getmembers(math, inspect.isfunction)
+    # Get all functions from a module (math's functions are C builtins)
+    # A single pass over __dict__ avoids getmembers()' getattr() per name
+    functions = [
+        (name, value) for name, value in math.__dict__.items()
+        if inspect.isbuiltin(value) or inspect.isfunction(value)
+    ]
     print(f"   Number of functions in math: {len(functions)}")
 
 
+@_buffered
 def demonstrate_import_best_practices():
     """Demonstrate import best practices and patterns"""
-    print("\n" + "=" * 60)
-    print("IMPORT BEST PRACTICES")
-    print("=" * 60)
-
-    print("\n1. Import Order (PEP 8):")
-    print("   # 1. Standard library imports")
-    print("   import os")
-    print("   import sys")
-    print("   from pathlib import Path")
-    print("")
-    print("   # 2. Related third-party library imports")
-    print("   import requests")
-    print("   import numpy as np")
-    print("")
-    print("   # 3. Local application/library imports")
-    print("   from mypackage import mymodule")
-    print("   from . import sibling_module")
-
-    print("\n2. Avoid Import * (except for specific cases):")
-    print("   ❌ from math import *  # Pollutes namespace")
-    print("   ✅ from math import sqrt, pi  # Explicit imports")
-    print("   ✅ import math  # Use qualified names")
-
-    print("\n3. Use meaningful aliases:")
-    print("   ✅ import numpy as np  # Standard, widely recognized")
-    print("   ✅ import pandas as pd  # Standard, widely recognized")
-    print("   ❌ import numpy as n  # Not clear")
-
-    print("\n4. Lazy imports (import when needed):")
-    print("   def expensive_operation():")
-    print("       import expensive_module  # Only imported when function is called")
-    print("       return expensive_module.do_work()")
-
-    print("\n5. Handling optional dependencies:")
-    print("   try:")
-    print("       import optional_package")
-    print("       HAS_OPTIONAL = True")
-    print("   except ImportError:")
-    print("       HAS_OPTIONAL = False")
-    print("")
-    print("   def feature_that_needs_optional():")
-    print("       if not HAS_OPTIONAL:")
-    print("           raise ImportError('optional_package required for this feature')")
-
-    print("\n6. Module-level imports vs function-level imports:")
-    print("   # Module level (preferred for most cases)")
-    print("   import requests")
-    print("")
-    print("   # Function level (for conditional/optional imports)")
-    print("   def download_file():")
-    print("       import requests  # Only if needed")
-
-
+    print(_header("IMPORT BEST PRACTICES"))
+
+    # One print of the whole block instead of one call per line
+    print("""
+1. Import Order (PEP 8):
+   # 1. Standard library imports
+   import os
+   import sys
+   from pathlib import Path
+
+   # 2. Related third-party library imports
+   import requests
+   import numpy as np
+
+   # 3. Local application/library imports
+   from mypackage import mymodule
+   from . import sibling_module
+
+2. Avoid Import * (except for specific cases):
+   ❌ from math import *  # Pollutes namespace
+   ✅ from math import sqrt, pi  # Explicit imports
+   ✅ import math  # Use qualified names
+
+3. Use meaningful aliases:
+   ✅ import numpy as np  # Standard, widely recognized
+   ✅ import pandas as pd  # Standard, widely recognized
+   ❌ import numpy as n  # Not clear
+
+4. Lazy imports (import when needed):
+   def expensive_operation():
+       import expensive_module  # Only imported when function is called
+       return expensive_module.do_work()
+
+5. Handling optional dependencies:
+   try:
+       import optional_package
+       HAS_OPTIONAL = True
+   except ImportError:
+       HAS_OPTIONAL = False
+
+   def feature_that_needs_optional():
+       if not HAS_OPTIONAL:
+           raise ImportError('optional_package required for this feature')
+
+6. Module-level imports vs function-level imports:
+   # Module level (preferred for most cases)
+   import requests
+
+   # Function level (for conditional/optional imports)
+   def download_file():
+       import requests  # Only if needed""")
+
+
+@_buffered
 def demonstrate_package_structure():
     """Demonstrate package structure and __init__.py"""
-    print("\n" + "=" * 60)
-    print("PACKAGE STRUCTURE AND __init__.py")
-    print("=" * 60)
+    print(_header("PACKAGE STRUCTURE AND __init__.py"))
 
     print("\n1. Basic Package Structure:")
     print("   mypackage/")
@@ -441,21 +481,47 @@ def demonstrate_package_structure():
     print("   from mypackage.subpackage import submodule")
 
 
+# Directories already created by this process, so re-runs skip the mkdir syscalls
+_created_dirs = set()
+
+
+def _ensure_dir(path):
+    """Create path (and parents) once per process"""
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+
+
+def _write_if_changed(path, content):
+    """Write content to path unless the file already holds exactly that
+
+    Leaving an unchanged file alone keeps its mtime, so the .pyc compiled
+    from it on an earlier run stays valid.
+    """
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                return
+    except OSError:
+        pass
+    with open(path, "w") as f:
+        f.write(content)
+
+
+@_buffered
 def create_sample_package():
     """Create a sample package structure for demonstration"""
-    print("\n" + "=" * 60)
-    print("CREATING SAMPLE PACKAGE")
-    print("=" * 60)
+    print(_header("CREATING SAMPLE PACKAGE"))
 
     # Create sample package directory structure
     base_dir = Path("sample_package_demo")
     package_dir = base_dir / "myutils"
 
     try:
-        # Create directories
-        package_dir.mkdir(parents=True, exist_ok=True)
+        # Create directories (skipping ones this process already made)
         subpackage_dir = package_dir / "helpers"
-        subpackage_dir.mkdir(exist_ok=True)
+        _ensure_dir(package_dir)
+        _ensure_dir(subpackage_dir)
 
         # Create __init__.py files
         init_content = '''"""
@@ -465,18 +531,28 @@ MyUtils Package - A sample package for demonstration
 __version__ = "1.0.0"
 __author__ = "Python Tutorial"
 
-# Import commonly used functions
-from .math_utils import add, multiply
-from .string_utils import reverse_string
-
 # Define what gets imported with "from myutils import *"
-__all__ = ["add", "multiply", "reverse_string"]
-
-print("MyUtils package initialized!")
+__all__ = ("add", "multiply", "reverse_string")
+
+# Map each public name to the submodule that defines it
+_LAZY_ATTRS = {
+    "add": ".math_utils",
+    "multiply": ".math_utils",
+    "reverse_string": ".string_utils",
+}
+
+
+def __getattr__(name):
+    """Import submodules on first attribute access (PEP 562)"""
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 '''
 
-        with open(package_dir / "__init__.py", "w") as f:
-            f.write(init_content)
+        _write_if_changed(package_dir / "__init__.py", init_content)
 
         # Create math_utils.py
         math_utils_content = '''"""
@@ -492,14 +568,14 @@ def multiply(a, b):
     return a * b
 
 def factorial(n):
-    """Calculate factorial of n"""
-    if n <= 1:
-        return 1
-    return n * factorial(n - 1)
+    """Calculate factorial of n (iterative, so large n cannot hit RecursionError)"""
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
 '''
 
-        with open(package_dir / "math_utils.py", "w") as f:
-            f.write(math_utils_content)
+        _write_if_changed(package_dir / "math_utils.py", math_utils_content)
 
         # Create string_utils.py
         string_utils_content = '''"""
@@ -516,12 +592,11 @@ def capitalize_words(s):
 
 def count_vowels(s):
     """Count vowels in a string"""
-    vowels = 'aeiouAEIOU'
-    return sum(1 for char in s if char in vowels)
+    # One C-level str.count per vowel instead of a Python loop per character
+    return sum(map(s.count, 'aeiouAEIOU'))
 '''
 
-        with open(package_dir / "string_utils.py", "w") as f:
-            f.write(string_utils_content)
+        _write_if_changed(package_dir / "string_utils.py", string_utils_content)
 
         # Create subpackage
         subpackage_init = '''"""
@@ -533,8 +608,7 @@ from .formatters import format_number, format_date
 __all__ = ["format_number", "format_date"]
 '''
 
-        with open(subpackage_dir / "__init__.py", "w") as f:
-            f.write(subpackage_init)
+        _write_if_changed(subpackage_dir / "__init__.py", subpackage_init)
 
         formatters_content = '''"""
 Formatting helper functions
@@ -549,18 +623,24 @@ def format_date(date_obj):
     return date_obj.strftime("%Y-%m-%d")
 '''
 
-        with open(subpackage_dir / "formatters.py", "w") as f:
-            f.write(formatters_content)
+        _write_if_changed(subpackage_dir / "formatters.py", formatters_content)
 
         print(f"✅ Created sample package at: {package_dir.absolute()}")
         print("\nPackage structure:")
+        tree_lines = []
         for root, dirs, files in os.walk(package_dir):
             level = root.replace(str(package_dir), '').count(os.sep)
             indent = ' ' * 2 * level
-            print(f"{indent}{os.path.basename(root)}/")
+            tree_lines.append(f"{indent}{os.path.basename(root)}/")
             subindent = ' ' * 2 * (level + 1)
-            for file in files:
-                print(f"{subindent}{file}")
+            tree_lines.extend(f"{subindent}{file}" for file in files)
+        print("\n".join(tree_lines))
+
+        # Byte-compile the package in one batch. Unchanged sources are not
+        # rewritten above, so on later runs every .pyc is still current and
+        # this only stats the files; the import then loads the cached .pyc
+        import compileall
+        compileall.compile_dir(package_dir, quiet=1)
 
         # Demonstrate importing from the created package
         print("\n3. Importing from created package:")
@@ -595,24 +675,54 @@ def format_date(date_obj):
         print(f"❌ Failed to create sample package: {e}")
 
 
-def main():
+# Demo name -> function, in the order main() runs them
+DEMOS = {
+    "builtin": demonstrate_builtin_imports,
+    "variations": demonstrate_import_variations,
+    "third_party": demonstrate_third_party_imports,
+    "local": demonstrate_local_imports,
+    "dynamic": demonstrate_dynamic_imports,
+    "inspection": demonstrate_import_inspection,
+    "best_practices": demonstrate_import_best_practices,
+    "package_structure": demonstrate_package_structure,
+    "sample_package": create_sample_package,
+}
+
+
+def parse_args(argv=None):
+    """Parse command line options for selecting which demos to run"""
+    import argparse  # Only needed when running as a script
+
+    parser = argparse.ArgumentParser(description="Library import tutorial")
+    parser.add_argument(
+        "--only",
+        default="all",
+        help=f"comma-separated demos to run ({', '.join(DEMOS)}) or 'all'",
+    )
+    args = parser.parse_args(argv)
+
+    if args.only == "all":
+        args.demos = list(DEMOS)
+    else:
+        args.demos = [name.strip() for name in args.only.split(",") if name.strip()]
+        unknown = [name for name in args.demos if name not in DEMOS]
+        if unknown:
+            parser.error(f"unknown demo(s): {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
     """Main function demonstrating all import concepts"""
+    args = parse_args(argv)
+
     print("📦 COMPREHENSIVE LIBRARY IMPORT TUTORIAL")
     print("This tutorial covers all aspects of importing libraries and modules in Python.")
 
-    demonstrate_builtin_imports()
-    demonstrate_import_variations()
-    demonstrate_third_party_imports()
-    demonstrate_local_imports()
-    demonstrate_dynamic_imports()
-    demonstrate_import_inspection()
-    demonstrate_import_best_practices()
-    demonstrate_package_structure()
-    create_sample_package()
-
-    print("\n" + "=" * 60)
-    print("LIBRARY IMPORT TUTORIAL COMPLETED!")
-    print("=" * 60)
+    # Skipped demos never run, so their lazy imports are never paid for
+    for name in args.demos:
+        DEMOS[name]()
+
+    print(_header("LIBRARY IMPORT TUTORIAL COMPLETED!"))
 
     print("\n💡 Key Import Concepts:")
     print("- import module_name")
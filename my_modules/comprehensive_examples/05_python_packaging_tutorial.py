@@ -13,63 +13,26 @@ This module demonstrates how to:
 - Manage dependencies
 """
 
+import functools
+import io
 import os
 import sys
-import subprocess
-import shutil
+import tarfile
+import time
 from pathlib import Path
-from datetime import datetime
-import json
+from string import Template
+from typing import Final
+from concurrent.futures import ThreadPoolExecutor
 
 
-def create_sample_package_structure():
-    """Create a complete sample package structure"""
-    print("=" * 60)
-    print("CREATING SAMPLE PACKAGE STRUCTURE")
-    print("=" * 60)
-
-    # Define package structure
-    package_name = "awesome_calculator"
-    base_dir = Path(f"{package_name}_demo")
-
-    # Create directory structure
-    structure = {
-        base_dir: None,
-        base_dir / package_name: None,
-        base_dir / package_name / "core": None,
-        base_dir / package_name / "utils": None,
-        base_dir / "tests": None,
-        base_dir / "docs": None,
-        base_dir / "examples": None,
-    }
-
-    print(f"\n1. Creating package directory structure for '{package_name}':")
-
-    try:
-        # Create directories
-        for directory in structure.keys():
-            directory.mkdir(parents=True, exist_ok=True)
-            print(f"   ✅ Created: {directory}")
-
-        # Create package files
-        create_package_files(base_dir, package_name)
-
-        print(f"\n✅ Package structure created successfully!")
-        return base_dir
-
-    except Exception as e:
-        print(f"❌ Failed to create package structure: {e}")
-        return None
-
+# Static file bodies and templates for the sample package are built once at
+# import time instead of being re-created on every scaffold call. Bodies that
+# do not depend on the package name are stored already UTF-8 encoded and
+# marked Final: they are written verbatim and must never be rebound.
 
-def create_package_files(base_dir: Path, package_name: str):
-    """Create all necessary package files"""
-
-    print(f"\n2. Creating package files:")
-
-    # 1. Main package __init__.py
-    init_py_content = f'''"""
-{package_name} - An awesome calculator package
+# Package __init__.py, rendered with $package_name
+_INIT_PY_TEMPLATE = Template('''"""
+${package_name} - An awesome calculator package
 
 A comprehensive calculator package with basic arithmetic,
 scientific functions, and utility operations.
@@ -97,19 +60,268 @@ __all__ = [
 ]
 
 # Package initialization
-print(f"{{package_name}} v{{__version__}} loaded successfully!")
-'''
+print(f"{package_name} v{__version__} loaded successfully!")
+''')
+
+
+# setup.py, rendered with $package_name
+_SETUP_PY_TEMPLATE = Template('''"""
+Setup script for ${package_name}
+"""
+
+from setuptools import setup, find_packages
+from pathlib import Path
+
+# Read the README file
+this_directory = Path(__file__).parent
+long_description = (this_directory / "README.md").read_text(encoding="utf-8")
+
+# Read requirements
+def read_requirements(filename):
+    try:
+        with open(filename, 'r') as f:
+            return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    except FileNotFoundError:
+        return []
+
+setup(
+    name="${package_name}",
+    version="1.0.0",
+    author="Python Developer",
+    author_email="developer@example.com",
+    description="An awesome calculator package for Python",
+    long_description=long_description,
+    long_description_content_type="text/markdown",
+    url="https://github.com/yourusername/${package_name}",
+    project_urls={
+        "Bug Reports": "https://github.com/yourusername/${package_name}/issues",
+        "Source": "https://github.com/yourusername/${package_name}",
+        "Documentation": "https://awesome-calculator.readthedocs.io/",
+    },
+    packages=find_packages(exclude=["tests*"]),
+    classifiers=[
+        "Development Status :: 4 - Beta",
+        "Intended Audience :: Developers",
+        "Intended Audience :: Education",
+        "Topic :: Scientific/Engineering :: Mathematics",
+        "License :: OSI Approved :: MIT License",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
+    ],
+    python_requires=">=3.8",
+    install_requires=read_requirements("requirements.txt"),
+    extras_require={
+        "dev": read_requirements("requirements-dev.txt"),
+        "test": ["pytest>=7.0", "pytest-cov>=4.0"],
+        "docs": ["sphinx>=5.0", "sphinx-rtd-theme>=1.0"],
+    },
+    entry_points={
+        "console_scripts": [
+            "${package_name}=${package_name}.cli:main",
+        ],
+    },
+    include_package_data=True,
+    package_data={
+        "${package_name}": ["data/*.json", "templates/*.txt"],
+    },
+    keywords="calculator mathematics arithmetic scientific",
+    zip_safe=False,
+)
+''')
+
+
+# tests/test_calculator.py, rendered with $package_name
+_TEST_CALCULATOR_TEMPLATE = Template('''"""
+Tests for the Calculator class
+"""
+
+import pytest
+from ${package_name}.core.calculator import Calculator
+
+
+class TestCalculator:
+    """Test cases for Calculator class"""
+
+    def setup_method(self):
+        """Setup test calculator instance"""
+        self.calc = Calculator()
+
+    def test_add(self):
+        """Test addition operation"""
+        result = self.calc.add(2, 3)
+        assert result == 5
+        assert "2 + 3 = 5" in self.calc.get_history()
+
+    def test_subtract(self):
+        """Test subtraction operation"""
+        result = self.calc.subtract(10, 4)
+        assert result == 6
+        assert "10 - 4 = 6" in self.calc.get_history()
+
+    def test_multiply(self):
+        """Test multiplication operation"""
+        result = self.calc.multiply(6, 7)
+        assert result == 42
+        assert "6 × 7 = 42" in self.calc.get_history()
+
+    def test_divide(self):
+        """Test division operation"""
+        result = self.calc.divide(15, 3)
+        assert result == 5
+        assert "15 ÷ 3 = 5" in self.calc.get_history()
+
+    def test_divide_by_zero(self):
+        """Test division by zero raises ValueError"""
+        with pytest.raises(ValueError, match="Division by zero is not allowed"):
+            self.calc.divide(10, 0)
+
+    def test_power(self):
+        """Test power operation"""
+        result = self.calc.power(2, 3)
+        assert result == 8
+        assert "2 ^ 3 = 8" in self.calc.get_history()
+
+    def test_memory_operations(self):
+        """Test memory store, recall, and clear"""
+        self.calc.memory_store(42)
+        assert self.calc.memory_recall() == 42
+
+        self.calc.memory_clear()
+        assert self.calc.memory_recall() == 0
+
+    def test_history_operations(self):
+        """Test history functionality"""
+        self.calc.add(1, 2)
+        self.calc.multiply(3, 4)
+
+        history = self.calc.get_history()
+        assert len(history) == 2
+        assert "1 + 2 = 3" in history
+        assert "3 × 4 = 12" in history
+
+        self.calc.clear_history()
+        assert len(self.calc.get_history()) == 0
+
+    def test_invalid_input_types(self):
+        """Test invalid input types raise TypeError"""
+        with pytest.raises(TypeError):
+            self.calc.add("2", 3)
+
+        with pytest.raises(TypeError):
+            self.calc.multiply(2, "3")
+''')
 
-    with open(base_dir / package_name / "__init__.py", "w") as f:
-        f.write(init_py_content)
-    print("   ✅ Created: __init__.py")
 
-    # 2. Core calculator module
-    calculator_py_content = '''"""
-Core calculator functionality
+# tests/test_scientific.py, rendered with $package_name
+_TEST_SCIENTIFIC_TEMPLATE = Template('''"""
+Tests for the ScientificCalculator class
 """
 
-from typing import Union, List, Optional
+import math
+import pytest
+from ${package_name}.core.scientific import ScientificCalculator
+
+
+class TestScientificCalculator:
+    """Test cases for ScientificCalculator class"""
+
+    def setup_method(self):
+        """Setup test scientific calculator instance"""
+        self.calc = ScientificCalculator()
+
+    def test_inheritance(self):
+        """Test that ScientificCalculator inherits from Calculator"""
+        # Should have basic calculator functionality
+        result = self.calc.add(2, 3)
+        assert result == 5
+
+    def test_sin(self):
+        """Test sine function"""
+        result = self.calc.sin(math.pi / 2)
+        assert abs(result - 1.0) < 1e-10
+
+        result_degrees = self.calc.sin(90, degrees=True)
+        assert abs(result_degrees - 1.0) < 1e-10
+
+    def test_cos(self):
+        """Test cosine function"""
+        result = self.calc.cos(0)
+        assert abs(result - 1.0) < 1e-10
+
+        result_degrees = self.calc.cos(0, degrees=True)
+        assert abs(result_degrees - 1.0) < 1e-10
+
+    def test_tan(self):
+        """Test tangent function"""
+        result = self.calc.tan(math.pi / 4)
+        assert abs(result - 1.0) < 1e-10
+
+        result_degrees = self.calc.tan(45, degrees=True)
+        assert abs(result_degrees - 1.0) < 1e-10
+
+    def test_log_natural(self):
+        """Test natural logarithm"""
+        result = self.calc.log(math.e)
+        assert abs(result - 1.0) < 1e-10
+
+    def test_log_base_10(self):
+        """Test logarithm base 10"""
+        result = self.calc.log(100, 10)
+        assert abs(result - 2.0) < 1e-10
+
+    def test_log_invalid_arguments(self):
+        """Test logarithm with invalid arguments"""
+        with pytest.raises(ValueError, match="Logarithm argument must be positive"):
+            self.calc.log(-1)
+
+        with pytest.raises(ValueError, match="Logarithm base must be positive"):
+            self.calc.log(10, -1)
+
+        with pytest.raises(ValueError, match="not equal to 1"):
+            self.calc.log(10, 1)
+
+    def test_sqrt(self):
+        """Test square root function"""
+        result = self.calc.sqrt(16)
+        assert result == 4
+
+        result = self.calc.sqrt(2)
+        assert abs(result - math.sqrt(2)) < 1e-10
+
+    def test_sqrt_negative(self):
+        """Test square root of negative number"""
+        with pytest.raises(ValueError, match="Square root of negative number"):
+            self.calc.sqrt(-1)
+
+    def test_factorial(self):
+        """Test factorial function"""
+        assert self.calc.factorial(0) == 1
+        assert self.calc.factorial(1) == 1
+        assert self.calc.factorial(5) == 120
+
+    def test_factorial_invalid(self):
+        """Test factorial with invalid arguments"""
+        with pytest.raises(ValueError, match="non-negative integer"):
+            self.calc.factorial(-1)
+
+        with pytest.raises(ValueError, match="non-negative integer"):
+            self.calc.factorial(3.14)
+''')
+
+# Every generated module starts with the same docstring/blank-line header;
+# only the one-line summary differs. The core summary is shared with
+# core/__init__.py.
+_MODULE_HEADER = b'"""\n%s\n"""\n\n'
+_PACKAGE_HEADER = b'"""%s"""\n'
+_CORE_DOC = b"Core calculator functionality"
+
+
+# Core calculator module (core/calculator.py)
+_CALCULATOR_PY: Final[bytes] = _MODULE_HEADER % _CORE_DOC + '''from typing import Union, List, Optional
 from ..utils.validators import validate_number
 
 
@@ -182,24 +394,11 @@ class Calculator:
     def memory_clear(self) -> None:
         """Clear memory"""
         self.memory = 0.0
-'''
+'''.encode("utf-8")
 
-    # Create core directory files
-    core_dir = base_dir / package_name / "core"
-    with open(core_dir / "__init__.py", "w") as f:
-        f.write('"""Core calculator functionality"""\\n')
-    print("   ✅ Created: core/__init__.py")
 
-    with open(core_dir / "calculator.py", "w") as f:
-        f.write(calculator_py_content)
-    print("   ✅ Created: core/calculator.py")
-
-    # 3. Scientific calculator module
-    scientific_py_content = '''"""
-Scientific calculator with advanced mathematical functions
-"""
-
-import math
+# Scientific calculator module (core/scientific.py)
+_SCIENTIFIC_PY: Final[bytes] = _MODULE_HEADER % b"Scientific calculator with advanced mathematical functions" + '''import math
 from typing import Union
 from .calculator import Calculator
 from ..utils.validators import validate_number
@@ -271,24 +470,11 @@ class ScientificCalculator(Calculator):
         result = math.factorial(n)
         self.history.append(f"{n}! = {result}")
         return result
-'''
+'''.encode("utf-8")
 
-    with open(core_dir / "scientific.py", "w") as f:
-        f.write(scientific_py_content)
-    print("   ✅ Created: core/scientific.py")
 
-    # 4. Utils modules
-    utils_dir = base_dir / package_name / "utils"
-    with open(utils_dir / "__init__.py", "w") as f:
-        f.write('"""Utility functions for the calculator package"""\\n')
-    print("   ✅ Created: utils/__init__.py")
-
-    # Validators module
-    validators_py_content = '''"""
-Input validation utilities
-"""
-
-from typing import Union
+# Input validators (utils/validators.py)
+_VALIDATORS_PY: Final[bytes] = _MODULE_HEADER % b"Input validation utilities" + '''from typing import Union
 
 
 def validate_number(value: Union[int, float], name: str = "value") -> None:
@@ -315,18 +501,11 @@ def validate_range(value: float, min_val: float = None, max_val: float = None, n
 
     if max_val is not None and value > max_val:
         raise ValueError(f"{name} must be <= {max_val}, got {value}")
-'''
+'''.encode("utf-8")
 
-    with open(utils_dir / "validators.py", "w") as f:
-        f.write(validators_py_content)
-    print("   ✅ Created: utils/validators.py")
 
-    # Formatters module
-    formatters_py_content = '''"""
-Output formatting utilities
-"""
-
-from typing import Union
+# Output formatters (utils/formatters.py)
+_FORMATTERS_PY: Final[bytes] = _MODULE_HEADER % b"Output formatting utilities" + '''from typing import Union
 from decimal import Decimal, ROUND_HALF_UP
 
 
@@ -360,207 +539,17 @@ def format_percentage(value: float, precision: int = 2) -> str:
 def format_scientific(value: float, precision: int = 2) -> str:
     """Format number in scientific notation"""
     return f"{value:.{precision}e}"
-'''
-
-    with open(utils_dir / "formatters.py", "w") as f:
-        f.write(formatters_py_content)
-    print("   ✅ Created: utils/formatters.py")
-
-    # 5. Create setup.py
-    create_setup_files(base_dir, package_name)
-
-    # 6. Create tests
-    create_test_files(base_dir, package_name)
-
-    # 7. Create documentation files
-    create_documentation_files(base_dir, package_name)
-
-    # 8. Create example files
-    create_example_files(base_dir, package_name)
+'''.encode("utf-8")
 
 
-def create_setup_files(base_dir: Path, package_name: str):
-    """Create setup and configuration files"""
+# Sub-package __init__.py files (core/, utils/, tests/)
+_CORE_INIT_PY: Final[bytes] = _PACKAGE_HEADER % _CORE_DOC
+_UTILS_INIT_PY: Final[bytes] = _PACKAGE_HEADER % b"Utility functions for the calculator package"
+_TESTS_INIT_PY: Final[bytes] = b""
 
-    print(f"\n3. Creating setup and configuration files:")
 
-    # 1. setup.py (traditional approach)
-    setup_py_content = f'''"""
-Setup script for {package_name}
-"""
-
-from setuptools import setup, find_packages
-from pathlib import Path
-
-# Read the README file
-this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text(encoding="utf-8")
-
-# Read requirements
-def read_requirements(filename):
-    try:
-        with open(filename, 'r') as f:
-            return [line.strip() for line in f if line.strip() and not line.startswith('#')]
-    except FileNotFoundError:
-        return []
-
-setup(
-    name="{package_name}",
-    version="1.0.0",
-    author="Python Developer",
-    author_email="developer@example.com",
-    description="An awesome calculator package for Python",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/yourusername/{package_name}",
-    project_urls={{
-        "Bug Reports": "https://github.com/yourusername/{package_name}/issues",
-        "Source": "https://github.com/yourusername/{package_name}",
-        "Documentation": "https://awesome-calculator.readthedocs.io/",
-    }},
-    packages=find_packages(exclude=["tests*"]),
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Intended Audience :: Education",
-        "Topic :: Scientific/Engineering :: Mathematics",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-    ],
-    python_requires=">=3.8",
-    install_requires=read_requirements("requirements.txt"),
-    extras_require={{
-        "dev": read_requirements("requirements-dev.txt"),
-        "test": ["pytest>=7.0", "pytest-cov>=4.0"],
-        "docs": ["sphinx>=5.0", "sphinx-rtd-theme>=1.0"],
-    }},
-    entry_points={{
-        "console_scripts": [
-            "{package_name}={package_name}.cli:main",
-        ],
-    }},
-    include_package_data=True,
-    package_data={{
-        "{package_name}": ["data/*.json", "templates/*.txt"],
-    }},
-    keywords="calculator mathematics arithmetic scientific",
-    zip_safe=False,
-)
-'''
-
-    with open(base_dir / "setup.py", "w") as f:
-        f.write(setup_py_content)
-    print("   ✅ Created: setup.py")
-
-    # 2. pyproject.toml (modern approach)
-    pyproject_toml_content = f'''[build-system]
-requires = ["setuptools>=45", "wheel", "setuptools_scm[toml]>=6.2"]
-build-backend = "setuptools.build_meta"
-
-[project]
-name = "{package_name}"
-version = "1.0.0"
-description = "An awesome calculator package for Python"
-readme = "README.md"
-license = {{file = "LICENSE"}}
-authors = [
-    {{name = "Python Developer", email = "developer@example.com"}},
-]
-maintainers = [
-    {{name = "Python Developer", email = "developer@example.com"}},
-]
-keywords = ["calculator", "mathematics", "arithmetic", "scientific"]
-classifiers = [
-    "Development Status :: 4 - Beta",
-    "Intended Audience :: Developers",
-    "Intended Audience :: Education",
-    "Topic :: Scientific/Engineering :: Mathematics",
-    "License :: OSI Approved :: MIT License",
-    "Programming Language :: Python :: 3",
-    "Programming Language :: Python :: 3.8",
-    "Programming Language :: Python :: 3.9",
-    "Programming Language :: Python :: 3.10",
-    "Programming Language :: Python :: 3.11",
-    "Programming Language :: Python :: 3.12",
-]
-requires-python = ">=3.8"
-dependencies = [
-    # Add your dependencies here
-    # "requests>=2.28.0",
-    # "click>=8.0.0",
-]
-
-[project.optional-dependencies]
-dev = [
-    "black>=22.0",
-    "isort>=5.0",
-    "flake8>=5.0",
-    "mypy>=1.0",
-    "pre-commit>=2.0",
-]
-test = [
-    "pytest>=7.0",
-    "pytest-cov>=4.0",
-    "pytest-mock>=3.0",
-]
-docs = [
-    "sphinx>=5.0",
-    "sphinx-rtd-theme>=1.0",
-    "myst-parser>=0.18",
-]
-
-[project.urls]
-Homepage = "https://github.com/yourusername/{package_name}"
-Documentation = "https://awesome-calculator.readthedocs.io/"
-Repository = "https://github.com/yourusername/{package_name}.git"
-"Bug Reports" = "https://github.com/yourusername/{package_name}/issues"
-Changelog = "https://github.com/yourusername/{package_name}/blob/main/CHANGELOG.md"
-
-[project.scripts]
-{package_name} = "{package_name}.cli:main"
-
-[tool.setuptools]
-package-dir = {{"{package_name}" = "{package_name}"}}
-
-[tool.setuptools.packages.find]
-include = ["{package_name}*"]
-exclude = ["tests*"]
-
-[tool.black]
-line-length = 88
-target-version = ['py38']
-include = '\\.pyi?$'
-
-[tool.isort]
-profile = "black"
-multi_line_output = 3
-line_length = 88
-
-[tool.mypy]
-python_version = "3.8"
-warn_return_any = true
-warn_unused_configs = true
-disallow_untyped_defs = true
-
-[tool.pytest.ini_options]
-testpaths = ["tests"]
-python_files = ["test_*.py", "*_test.py"]
-python_classes = ["Test*"]
-python_functions = ["test_*"]
-addopts = "--cov={package_name} --cov-report=html --cov-report=term-missing"
-'''
-
-    with open(base_dir / "pyproject.toml", "w") as f:
-        f.write(pyproject_toml_content)
-    print("   ✅ Created: pyproject.toml")
-
-    # 3. MANIFEST.in
-    manifest_content = '''include README.md
+# MANIFEST.in
+_MANIFEST_IN: Final[bytes] = '''include README.md
 include LICENSE
 include CHANGELOG.md
 include requirements*.txt
@@ -569,24 +558,19 @@ recursive-include awesome_calculator/templates *.txt
 recursive-exclude tests *
 recursive-exclude * __pycache__
 recursive-exclude * *.py[co]
-'''
+'''.encode("utf-8")
 
-    with open(base_dir / "MANIFEST.in", "w") as f:
-        f.write(manifest_content)
-    print("   ✅ Created: MANIFEST.in")
 
-    # 4. Requirements files
-    requirements_content = '''# Core dependencies
+# requirements.txt
+_REQUIREMENTS_TXT: Final[bytes] = '''# Core dependencies
 # Add your package dependencies here
 # requests>=2.28.0
 # click>=8.0.0
-'''
+'''.encode("utf-8")
 
-    with open(base_dir / "requirements.txt", "w") as f:
-        f.write(requirements_content)
-    print("   ✅ Created: requirements.txt")
 
-    requirements_dev_content = '''# Development dependencies
+# requirements-dev.txt
+_REQUIREMENTS_DEV_TXT: Final[bytes] = '''# Development dependencies
 black>=22.0
 isort>=5.0
 flake8>=5.0
@@ -599,237 +583,186 @@ sphinx>=5.0
 sphinx-rtd-theme>=1.0
 twine>=4.0
 build>=0.8.0
-'''
-
-    with open(base_dir / "requirements-dev.txt", "w") as f:
-        f.write(requirements_dev_content)
-    print("   ✅ Created: requirements-dev.txt")
-
-
-def create_test_files(base_dir: Path, package_name: str):
-    """Create test files"""
-
-    print(f"\n4. Creating test files:")
-
-    tests_dir = base_dir / "tests"
-
-    # Test __init__.py
-    with open(tests_dir / "__init__.py", "w") as f:
-        f.write("")
-    print("   ✅ Created: tests/__init__.py")
-
-    # Test calculator
-    test_calculator_content = f'''"""
-Tests for the Calculator class
-"""
-
-import pytest
-from {package_name}.core.calculator import Calculator
-
-
-class TestCalculator:
-    """Test cases for Calculator class"""
-
-    def setup_method(self):
-        """Setup test calculator instance"""
-        self.calc = Calculator()
-
-    def test_add(self):
-        """Test addition operation"""
-        result = self.calc.add(2, 3)
-        assert result == 5
-        assert "2 + 3 = 5" in self.calc.get_history()
-
-    def test_subtract(self):
-        """Test subtraction operation"""
-        result = self.calc.subtract(10, 4)
-        assert result == 6
-        assert "10 - 4 = 6" in self.calc.get_history()
-
-    def test_multiply(self):
-        """Test multiplication operation"""
-        result = self.calc.multiply(6, 7)
-        assert result == 42
-        assert "6 × 7 = 42" in self.calc.get_history()
+'''.encode("utf-8")
 
-    def test_divide(self):
-        """Test division operation"""
-        result = self.calc.divide(15, 3)
-        assert result == 5
-        assert "15 ÷ 3 = 5" in self.calc.get_history()
 
-    def test_divide_by_zero(self):
-        """Test division by zero raises ValueError"""
-        with pytest.raises(ValueError, match="Division by zero is not allowed"):
-            self.calc.divide(10, 0)
-
-    def test_power(self):
-        """Test power operation"""
-        result = self.calc.power(2, 3)
-        assert result == 8
-        assert "2 ^ 3 = 8" in self.calc.get_history()
+# LICENSE
+_LICENSE: Final[bytes] = '''MIT License
 
-    def test_memory_operations(self):
-        """Test memory store, recall, and clear"""
-        self.calc.memory_store(42)
-        assert self.calc.memory_recall() == 42
-
-        self.calc.memory_clear()
-        assert self.calc.memory_recall() == 0
-
-    def test_history_operations(self):
-        """Test history functionality"""
-        self.calc.add(1, 2)
-        self.calc.multiply(3, 4)
-
-        history = self.calc.get_history()
-        assert len(history) == 2
-        assert "1 + 2 = 3" in history
-        assert "3 × 4 = 12" in history
-
-        self.calc.clear_history()
-        assert len(self.calc.get_history()) == 0
-
-    def test_invalid_input_types(self):
-        """Test invalid input types raise TypeError"""
-        with pytest.raises(TypeError):
-            self.calc.add("2", 3)
+Copyright (c) 2024 Python Developer
 
-        with pytest.raises(TypeError):
-            self.calc.multiply(2, "3")
-'''
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
 
-    with open(tests_dir / "test_calculator.py", "w") as f:
-        f.write(test_calculator_content)
-    print("   ✅ Created: tests/test_calculator.py")
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
 
-    # Test scientific calculator
-    test_scientific_content = f'''"""
-Tests for the ScientificCalculator class
-"""
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+'''.encode("utf-8")
 
-import math
-import pytest
-from {package_name}.core.scientific import ScientificCalculator
 
+# CHANGELOG.md
+_CHANGELOG_MD: Final[bytes] = '''# Changelog
 
-class TestScientificCalculator:
-    """Test cases for ScientificCalculator class"""
+All notable changes to this project will be documented in this file.
 
-    def setup_method(self):
-        """Setup test scientific calculator instance"""
-        self.calc = ScientificCalculator()
+The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
+and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
 
-    def test_inheritance(self):
-        """Test that ScientificCalculator inherits from Calculator"""
-        # Should have basic calculator functionality
-        result = self.calc.add(2, 3)
-        assert result == 5
+## [Unreleased]
 
-    def test_sin(self):
-        """Test sine function"""
-        result = self.calc.sin(math.pi / 2)
-        assert abs(result - 1.0) < 1e-10
+### Added
+- Nothing yet
 
-        result_degrees = self.calc.sin(90, degrees=True)
-        assert abs(result_degrees - 1.0) < 1e-10
+### Changed
+- Nothing yet
 
-    def test_cos(self):
-        """Test cosine function"""
-        result = self.calc.cos(0)
-        assert abs(result - 1.0) < 1e-10
+### Deprecated
+- Nothing yet
 
-        result_degrees = self.calc.cos(0, degrees=True)
-        assert abs(result_degrees - 1.0) < 1e-10
+### Removed
+- Nothing yet
 
-    def test_tan(self):
-        """Test tangent function"""
-        result = self.calc.tan(math.pi / 4)
-        assert abs(result - 1.0) < 1e-10
+### Fixed
+- Nothing yet
 
-        result_degrees = self.calc.tan(45, degrees=True)
-        assert abs(result_degrees - 1.0) < 1e-10
+### Security
+- Nothing yet
 
-    def test_log_natural(self):
-        """Test natural logarithm"""
-        result = self.calc.log(math.e)
-        assert abs(result - 1.0) < 1e-10
+## [1.0.0] - 2024-01-15
 
-    def test_log_base_10(self):
-        """Test logarithm base 10"""
-        result = self.calc.log(100, 10)
-        assert abs(result - 2.0) < 1e-10
+### Added
+- Initial release
+- Basic calculator functionality (add, subtract, multiply, divide, power)
+- Scientific calculator functionality (trigonometry, logarithms, square root, factorial)
+- Memory operations (store, recall, clear)
+- Calculation history
+- Input validation and error handling
+- Result formatting utilities
+- Comprehensive test suite
+- Type hints throughout codebase
+- Command-line interface
+- Documentation and examples
 
-    def test_log_invalid_arguments(self):
-        """Test logarithm with invalid arguments"""
-        with pytest.raises(ValueError, match="Logarithm argument must be positive"):
-            self.calc.log(-1)
+### Changed
+- Nothing (initial release)
 
-        with pytest.raises(ValueError, match="Logarithm base must be positive"):
-            self.calc.log(10, -1)
+### Fixed
+- Nothing (initial release)
+'''.encode("utf-8")
 
-        with pytest.raises(ValueError, match="not equal to 1"):
-            self.calc.log(10, 1)
 
-    def test_sqrt(self):
-        """Test square root function"""
-        result = self.calc.sqrt(16)
-        assert result == 4
+# pyproject.toml, rendered with $package_name
+_PYPROJECT_TOML_TEMPLATE = Template('''[build-system]
+requires = ["setuptools>=45", "wheel", "setuptools_scm[toml]>=6.2"]
+build-backend = "setuptools.build_meta"
 
-        result = self.calc.sqrt(2)
-        assert abs(result - math.sqrt(2)) < 1e-10
+[project]
+name = "${package_name}"
+version = "1.0.0"
+description = "An awesome calculator package for Python"
+readme = "README.md"
+license = {file = "LICENSE"}
+authors = [
+    {name = "Python Developer", email = "developer@example.com"},
+]
+maintainers = [
+    {name = "Python Developer", email = "developer@example.com"},
+]
+keywords = ["calculator", "mathematics", "arithmetic", "scientific"]
+classifiers = [
+    "Development Status :: 4 - Beta",
+    "Intended Audience :: Developers",
+    "Intended Audience :: Education",
+    "Topic :: Scientific/Engineering :: Mathematics",
+    "License :: OSI Approved :: MIT License",
+    "Programming Language :: Python :: 3",
+    "Programming Language :: Python :: 3.8",
+    "Programming Language :: Python :: 3.9",
+    "Programming Language :: Python :: 3.10",
+    "Programming Language :: Python :: 3.11",
+    "Programming Language :: Python :: 3.12",
+]
+requires-python = ">=3.8"
+dependencies = [
+    # Add your dependencies here
+    # "requests>=2.28.0",
+    # "click>=8.0.0",
+]
 
-    def test_sqrt_negative(self):
-        """Test square root of negative number"""
-        with pytest.raises(ValueError, match="Square root of negative number"):
-            self.calc.sqrt(-1)
+[project.optional-dependencies]
+dev = [
+    "black>=22.0",
+    "isort>=5.0",
+    "flake8>=5.0",
+    "mypy>=1.0",
+    "pre-commit>=2.0",
+]
+test = [
+    "pytest>=7.0",
+    "pytest-cov>=4.0",
+    "pytest-mock>=3.0",
+]
+docs = [
+    "sphinx>=5.0",
+    "sphinx-rtd-theme>=1.0",
+    "myst-parser>=0.18",
+]
 
-    def test_factorial(self):
-        """Test factorial function"""
-        assert self.calc.factorial(0) == 1
-        assert self.calc.factorial(1) == 1
-        assert self.calc.factorial(5) == 120
+[project.urls]
+Homepage = "https://github.com/yourusername/${package_name}"
+Documentation = "https://awesome-calculator.readthedocs.io/"
+Repository = "https://github.com/yourusername/${package_name}.git"
+"Bug Reports" = "https://github.com/yourusername/${package_name}/issues"
+Changelog = "https://github.com/yourusername/${package_name}/blob/main/CHANGELOG.md"
 
-    def test_factorial_invalid(self):
-        """Test factorial with invalid arguments"""
-        with pytest.raises(ValueError, match="non-negative integer"):
-            self.calc.factorial(-1)
+[project.scripts]
+${package_name} = "${package_name}.cli:main"
 
-        with pytest.raises(ValueError, match="non-negative integer"):
-            self.calc.factorial(3.14)
-'''
+[tool.setuptools]
+package-dir = {"${package_name}" = "${package_name}"}
 
-    with open(tests_dir / "test_scientific.py", "w") as f:
-        f.write(test_scientific_content)
-    print("   ✅ Created: tests/test_scientific.py")
+[tool.setuptools.packages.find]
+include = ["${package_name}*"]
+exclude = ["tests*"]
 
-    # pytest.ini
-    pytest_ini_content = '''[tool:pytest]
-testpaths = tests
-python_files = test_*.py *_test.py
-python_classes = Test*
-python_functions = test_*
-addopts =
-    -v
-    --tb=short
-    --cov=awesome_calculator
-    --cov-report=html
-    --cov-report=term-missing
-    --cov-fail-under=80
-'''
+[tool.black]
+line-length = 88
+target-version = ['py38']
+include = '\\.pyi?$$'
 
-    with open(tests_dir / "pytest.ini", "w") as f:
-        f.write(pytest_ini_content)
-    print("   ✅ Created: tests/pytest.ini")
+[tool.isort]
+profile = "black"
+multi_line_output = 3
+line_length = 88
 
+[tool.mypy]
+python_version = "3.8"
+warn_return_any = true
+warn_unused_configs = true
+disallow_untyped_defs = true
 
-def create_documentation_files(base_dir: Path, package_name: str):
-    """Create documentation files"""
+[tool.pytest.ini_options]
+testpaths = ["tests"]
+python_files = ["test_*.py", "*_test.py"]
+python_classes = ["Test*"]
+python_functions = ["test_*"]
+addopts = "-v --tb=short --cov=${package_name} --cov-report=html --cov-report=term-missing --cov-fail-under=80"
+''')
 
-    print(f"\n5. Creating documentation files:")
 
-    # README.md
-    readme_content = f'''# {package_name.replace("_", " ").title()}
+# README.md, rendered with $package_name
+_README_TEMPLATE = Template('''# ${project_title}
 
 An awesome calculator package for Python with basic arithmetic and scientific functions.
 
@@ -848,20 +781,20 @@ An awesome calculator package for Python with basic arithmetic and scientific fu
 
 ### From PyPI (when published)
 ```bash
-pip install {package_name}
+pip install ${package_name}
 ```
 
 ### From source
 ```bash
-git clone https://github.com/yourusername/{package_name}.git
-cd {package_name}
+git clone https://github.com/yourusername/${package_name}.git
+cd ${package_name}
 pip install -e .
 ```
 
 ### Development installation
 ```bash
-git clone https://github.com/yourusername/{package_name}.git
-cd {package_name}
+git clone https://github.com/yourusername/${package_name}.git
+cd ${package_name}
 pip install -e ".[dev]"
 ```
 
@@ -870,7 +803,7 @@ pip install -e ".[dev]"
 ### Basic Calculator
 
 ```python
-from {package_name} import Calculator
+from ${package_name} import Calculator
 
 calc = Calculator()
 
@@ -891,7 +824,7 @@ value = calc.memory_recall()   # 42
 ### Scientific Calculator
 
 ```python
-from {package_name} import ScientificCalculator
+from ${package_name} import ScientificCalculator
 import math
 
 calc = ScientificCalculator()
@@ -907,11 +840,11 @@ result = calc.factorial(5)         # 120
 ### Formatting Utilities
 
 ```python
-from {package_name} import format_result, format_currency
+from ${package_name} import format_result, format_currency
 
 # Format results
 formatted = format_result(3.14159, precision=2)  # "3.14"
-currency = format_currency(29.99)                # "$29.99"
+currency = format_currency(29.99)                # "$$29.99"
 ```
 
 ## Command Line Interface
@@ -919,7 +852,7 @@ currency = format_currency(29.99)                # "$29.99"
 After installation, you can use the calculator from the command line:
 
 ```bash
-{package_name} --help
+${package_name} --help
 ```
 
 ## API Reference
@@ -956,8 +889,8 @@ Inherits all methods from Calculator plus:
 
 ```bash
 # Clone the repository
-git clone https://github.com/yourusername/{package_name}.git
-cd {package_name}
+git clone https://github.com/yourusername/${package_name}.git
+cd ${package_name}
 
 # Create virtual environment
 python -m venv venv
@@ -977,7 +910,7 @@ pre-commit install
 pytest
 
 # Run with coverage
-pytest --cov={package_name}
+pytest --cov=${package_name}
 
 # Run specific test file
 pytest tests/test_calculator.py
@@ -987,13 +920,13 @@ pytest tests/test_calculator.py
 
 ```bash
 # Format code
-black {package_name}/ tests/
+black ${package_name}/ tests/
 
 # Sort imports
-isort {package_name}/ tests/
+isort ${package_name}/ tests/
 
 # Type checking
-mypy {package_name}/
+mypy ${package_name}/
 ```
 
 ### Building the package
@@ -1031,118 +964,342 @@ See [CHANGELOG.md](CHANGELOG.md) for version history and changes.
 ## Support
 
 - 📧 Email: developer@example.com
-- 🐛 Issues: [GitHub Issues](https://github.com/yourusername/{package_name}/issues)
+- 🐛 Issues: [GitHub Issues](https://github.com/yourusername/${package_name}/issues)
 - 📖 Documentation: [Read the Docs](https://awesome-calculator.readthedocs.io/)
 
 ## Acknowledgments
 
 - Thanks to the Python community for inspiration
 - Built with love and Python 🐍
-'''
-
-    with open(base_dir / "README.md", "w") as f:
-        f.write(readme_content)
-    print("   ✅ Created: README.md")
-
-    # LICENSE
-    license_content = '''MIT License
-
-Copyright (c) 2024 Python Developer
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-'''
+''')
 
-    with open(base_dir / "LICENSE", "w") as f:
-        f.write(license_content)
-    print("   ✅ Created: LICENSE")
 
-    # CHANGELOG.md
-    changelog_content = '''# Changelog
+def _render(template: Template, **mapping) -> bytes:
+    """Substitute a module-level template and encode the result as UTF-8"""
+    return template.substitute(**mapping).encode("utf-8")
 
-All notable changes to this project will be documented in this file.
 
-The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
-and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
+def _write_all(fd: int, data: bytes) -> None:
+    """Write every byte of data to fd; normally a single write(2)"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
-## [Unreleased]
 
-### Added
-- Nothing yet
+def _raw_write(path: Path, data: bytes) -> None:
+    """Write already-encoded bytes with plain os.open/os.write/os.close
 
-### Changed
-- Nothing yet
+    Skips the BufferedWriter/TextIOWrapper layers of open(); for a regular
+    file the loop normally finishes after a single write(2).
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
 
-### Deprecated
-- Nothing yet
 
-### Removed
-- Nothing yet
+def _stage(path: Path, data: bytes):
+    """Write data into an unnamed file in path's directory
 
-### Fixed
-- Nothing yet
+    Returns the open descriptor of the O_TMPFILE inode, which stays
+    invisible until _publish() links it in, or None where O_TMPFILE is
+    unavailable (non-Linux, or a filesystem without support).
+    """
+    try:
+        fd = os.open(path.parent, os.O_TMPFILE | os.O_WRONLY, 0o644)
+    except (AttributeError, OSError):
+        return None
+    try:
+        _write_all(fd, data)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _publish(fd: int, path: Path, data: bytes) -> None:
+    """Give a staged file its final name, then close its descriptor"""
+    # linkat() refuses to overwrite, so link under a temporary name and
+    # rename that over the target, which replaces it atomically
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        os.link(f"/proc/self/fd/{fd}", tmp)
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            # Don't leave the temporary name behind in the output tree
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except OSError:
+        # No /proc to link through (or the rename failed): plain write
+        _raw_write(path, data)
+    finally:
+        os.close(fd)
+
+
+def _is_current(path: Path, data: bytes) -> bool:
+    """Return True if path already holds exactly these bytes"""
+    try:
+        # A size mismatch settles it from the stat alone; otherwise compare
+        # the contents directly, which is as cheap as hashing both sides
+        return path.stat().st_size == len(data) and path.read_bytes() == data
+    except OSError:
+        return False
 
-### Security
-- Nothing yet
 
-## [1.0.0] - 2024-01-15
+def _sync_file(path: Path, data: bytes):
+    """Stage path unless a previous run already left identical content
 
-### Added
-- Initial release
-- Basic calculator functionality (add, subtract, multiply, divide, power)
-- Scientific calculator functionality (trigonometry, logarithms, square root, factorial)
-- Memory operations (store, recall, clear)
-- Calculation history
-- Input validation and error handling
-- Result formatting utilities
-- Comprehensive test suite
-- Type hints throughout codebase
-- Command-line interface
-- Documentation and examples
+    Returns the staged descriptor for _publish(), or None when nothing
+    is left to do (unchanged, or written directly without O_TMPFILE).
+    """
+    if _is_current(path, data):
+        return None
+    fd = _stage(path, data)
+    if fd is None:
+        _raw_write(path, data)
+    return fd
+
+
+def _write_manifest(manifest: list, executor: ThreadPoolExecutor) -> None:
+    """Write every (path, bytes) entry in the manifest on the given pool"""
+    # The writes are independent and I/O-bound, so run them concurrently;
+    # threads release the GIL while blocked in open()/write()/close()
+    futures = [executor.submit(_sync_file, *entry) for entry in manifest]
+
+    staged, error = [], None
+    for (path, data), future in zip(manifest, futures):
+        try:
+            fd = future.result()
+        except OSError as e:
+            error = error or e
+            continue
+        if fd is not None:
+            staged.append((fd, path, data))
+
+    # Best effort, and only where O_TMPFILE works: staged files are linked
+    # in only if every write succeeded, so a failed write publishes none of
+    # them. Files written directly (no O_TMPFILE) are already in place, and
+    # a _publish() that fails keeps whatever was published before it
+    published = 0
+    try:
+        if error is not None:
+            raise error
+        for fd, path, data in staged:
+            published += 1  # _publish() closes fd even when it raises
+            _publish(fd, path, data)
+    finally:
+        for fd, _, _ in staged[published:]:
+            os.close(fd)
+
+
+def _package_leaves(base_dir: Path, package_name: str) -> tuple:
+    """Return the leaf directories of the sample package layout"""
+    # Only the leaf directories are listed: os.makedirs() creates base_dir
+    # and base_dir/package_name on the way, so they need no call.
+    # The layout is only ever iterated, so a tuple is all it needs
+    package_dir = base_dir / package_name
+    return (
+        package_dir / "core",
+        package_dir / "utils",
+        base_dir / "tests",
+        base_dir / "docs",
+        base_dir / "examples",
+    )
+
+
+def _emit(log: list) -> None:
+    """Write the collected progress lines to stdout in one call
+
+    The text is encoded once and handed straight to the binary buffer
+    under sys.stdout, skipping the per-print TextIOWrapper work. Streams
+    without a buffer (e.g. io.StringIO under redirect_stdout) get a plain
+    write() instead.
+    """
+    text = "".join(log)
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None:
+        stdout.write(text)
+        return
+    # Anything already printed must come out first
+    stdout.flush()
+    buffer.write(text.encode(stdout.encoding or "utf-8", stdout.errors or "strict"))
+    buffer.flush()
 
-### Changed
-- Nothing (initial release)
 
-### Fixed
-- Nothing (initial release)
-'''
+def create_sample_package_structure():
+    """Create a complete sample package structure"""
+    # Progress for the whole run is collected here and written once at the
+    # end, including when a step fails part-way through
+    log = ["=" * 60, "\nCREATING SAMPLE PACKAGE STRUCTURE\n", "=" * 60, "\n"]
+    try:
+        # Define package structure
+        package_name = "awesome_calculator"
+        base_dir = Path(f"{package_name}_demo")
 
-    with open(base_dir / "CHANGELOG.md", "w") as f:
-        f.write(changelog_content)
-    print("   ✅ Created: CHANGELOG.md")
+        leaves = _package_leaves(base_dir, package_name)
 
+        log.append(f"\n1. Creating package directory structure for '{package_name}':\n")
 
-def create_example_files(base_dir: Path, package_name: str):
-    """Create example files"""
+        # Create directories; only this step has an expected failure mode
+        # (permissions, read-only filesystem), so only it is guarded
+        try:
+            for directory in leaves:
+                os.makedirs(directory, exist_ok=True)
+                log.append(f"   ✅ Created: {directory}\n")
+        except OSError as e:
+            log.append(f"❌ Failed to create package structure: {e}\n")
+            return None
 
-    print(f"\n6. Creating example files:")
+        # Create package files; one pool serves every helper's writes
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            create_package_files(base_dir, package_name, log, executor)
 
-    examples_dir = base_dir / "examples"
+        log.append("\n✅ Package structure created successfully!\n")
+        return base_dir
+    finally:
+        _emit(log)
+
+
+@functools.lru_cache(maxsize=8)
+def _package_sections(base_dir: Path, package_name: str) -> tuple:
+    """Return (progress text, entries) for every file group
+
+    Each group's status block is formatted together with its content, so
+    one pass over _SECTION_BUILDERS yields both what to write and what to
+    report. The result only depends on the arguments and is cached:
+    repeat scaffolds of the same package skip all formatting. Callers must
+    treat the returned entries as read-only.
+    """
+    package_dir = base_dir / package_name
+    sections = []
+    for title, in_package, build in _SECTION_BUILDERS:
+        root = package_dir if in_package else base_dir
+        entries = build(base_dir, package_name)
+        status = [f"\n{title}\n"]
+        status.extend(f"   ✅ Created: {path.relative_to(root).as_posix()}\n" for path, _ in entries)
+        sections.append(("".join(status), entries))
+    return tuple(sections)
+
+
+def create_package_files(base_dir: Path, package_name: str, log: list,
+                         executor: ThreadPoolExecutor):
+    """Create all necessary package files, appending progress lines to log
+
+    The writes are submitted to the caller's executor, so files from all
+    helpers are in flight together rather than one helper at a time.
+    """
+    # Collect every file up front as (path, bytes): the helpers only build
+    # content, and one loop writes the whole manifest
+    sections = _package_sections(base_dir, package_name)
+    manifest = [entry for _, entries in sections for entry in entries]
+    _write_manifest(manifest, executor)
+
+    # Progress is reported after the fact, once the whole manifest is written
+    log.extend(status for status, _ in sections)
+
+
+def create_sample_package_archive(dst: Path, package_name: str = "awesome_calculator") -> Path:
+    """Write the sample package straight into an uncompressed tar archive
+
+    Nothing is created on disk besides dst itself: tar records each
+    member's path, so no directories need to exist and the whole
+    scaffold goes out as one sequential stream.
+    """
+    base_dir = Path(f"{package_name}_demo")
+    mtime = time.time()
+    with tarfile.open(dst, "w") as archive:
+        # Directory members only matter for leaves that hold no files
+        # (docs/), but listing them all keeps their permissions explicit
+        for directory in _package_leaves(base_dir, package_name):
+            info = tarfile.TarInfo(directory.as_posix())
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            info.mtime = mtime
+            archive.addfile(info)
+        for _, entries in _package_sections(base_dir, package_name):
+            for path, data in entries:
+                info = tarfile.TarInfo(path.as_posix())
+                info.size = len(data)
+                info.mode = 0o644
+                info.mtime = mtime
+                archive.addfile(info, io.BytesIO(data))
+    return dst
+
+
+def create_module_files(base_dir: Path, package_name: str) -> list:
+    """Return (path, bytes) entries for the package's own modules"""
+
+    # Only __init__.py mentions the package name; every other module is a
+    # pre-encoded constant written as-is
+    package_dir = base_dir / package_name
+    core_dir = package_dir / "core"
+    utils_dir = package_dir / "utils"
+    return [
+        (package_dir / "__init__.py", _render(_INIT_PY_TEMPLATE, package_name=package_name)),
+        (core_dir / "__init__.py", _CORE_INIT_PY),
+        (core_dir / "calculator.py", _CALCULATOR_PY),
+        (core_dir / "scientific.py", _SCIENTIFIC_PY),
+        (utils_dir / "__init__.py", _UTILS_INIT_PY),
+        (utils_dir / "validators.py", _VALIDATORS_PY),
+        (utils_dir / "formatters.py", _FORMATTERS_PY),
+    ]
+
+
+def create_setup_files(base_dir: Path, package_name: str) -> list:
+    """Return (path, bytes) entries for setup and configuration files"""
+
+    return [
+        # setup.py (traditional approach) and pyproject.toml (modern approach)
+        (base_dir / "setup.py", _render(_SETUP_PY_TEMPLATE, package_name=package_name)),
+        (base_dir / "pyproject.toml", _render(_PYPROJECT_TOML_TEMPLATE, package_name=package_name)),
+        (base_dir / "MANIFEST.in", _MANIFEST_IN),
+        # Requirements files
+        (base_dir / "requirements.txt", _REQUIREMENTS_TXT),
+        (base_dir / "requirements-dev.txt", _REQUIREMENTS_DEV_TXT),
+    ]
+
+
+def create_test_files(base_dir: Path, package_name: str) -> list:
+    """Return (path, bytes) entries for test files"""
 
-    # Basic usage example
-    basic_example_content = f'''#!/usr/bin/env python3
+    tests_dir = base_dir / "tests"
+    return [
+        (tests_dir / "__init__.py", _TESTS_INIT_PY),
+        (tests_dir / "test_calculator.py", _render(_TEST_CALCULATOR_TEMPLATE, package_name=package_name)),
+        (tests_dir / "test_scientific.py", _render(_TEST_SCIENTIFIC_TEMPLATE, package_name=package_name)),
+    ]
+
+
+def create_documentation_files(base_dir: Path, package_name: str) -> list:
+    """Return (path, bytes) entries for documentation files"""
+
+    readme = _render(
+        _README_TEMPLATE,
+        package_name=package_name,
+        project_title=package_name.replace("_", " ").title(),
+    )
+    return [
+        (base_dir / "README.md", readme),
+        (base_dir / "LICENSE", _LICENSE),
+        (base_dir / "CHANGELOG.md", _CHANGELOG_MD),
+    ]
+
+
+# examples/basic_usage.py, split around $package_name so rendering is one bytes.join
+_BASIC_EXAMPLE_PARTS = '''#!/usr/bin/env python3
 """
 Basic Calculator Usage Example
 
-This example demonstrates the basic functionality of the {package_name} package.
+This example demonstrates the basic functionality of the ${package_name} package.
 """
 
-from {package_name} import Calculator, format_result
+from ${package_name} import Calculator, format_result
 
 def main():
     print("=== Basic Calculator Example ===\\n")
@@ -1153,16 +1310,16 @@ def main():
     # Perform calculations
     print("Performing basic calculations:")
     result1 = calc.add(15, 25)
-    print(f"15 + 25 = {{result1}}")
+    print(f"15 + 25 = {result1}")
 
     result2 = calc.multiply(7, 8)
-    print(f"7 × 8 = {{result2}}")
+    print(f"7 × 8 = {result2}")
 
     result3 = calc.divide(100, 4)
-    print(f"100 ÷ 4 = {{result3}}")
+    print(f"100 ÷ 4 = {result3}")
 
     result4 = calc.power(2, 10)
-    print(f"2^10 = {{result4}}")
+    print(f"2^10 = {result4}")
 
     # Memory operations
     print("\\nMemory operations:")
@@ -1170,40 +1327,43 @@ def main():
     print("Stored 42 in memory")
 
     remembered = calc.memory_recall()
-    print(f"Recalled from memory: {{remembered}}")
+    print(f"Recalled from memory: {remembered}")
 
     # Calculation history
     print("\\nCalculation history:")
     history = calc.get_history()
     for i, calculation in enumerate(history, 1):
-        print(f"{{i}}. {{calculation}}")
+        print(f"{i}. {calculation}")
 
     # Formatted results
     print("\\nFormatted results:")
     pi_approx = 22 / 7
     formatted = format_result(pi_approx, precision=4)
-    print(f"22/7 = {{formatted}}")
+    print(f"22/7 = {formatted}")
 
     print("\\n=== Example completed ===")
 
 if __name__ == "__main__":
     main()
-'''
+'''.encode("utf-8").split(b"${package_name}")
+
+
+@functools.lru_cache(maxsize=8)
+def _render_basic_example(package_name: str) -> bytes:
+    """Return examples/basic_usage.py rendered for package_name"""
+    return package_name.encode("utf-8").join(_BASIC_EXAMPLE_PARTS)
 
-    with open(examples_dir / "basic_usage.py", "w") as f:
-        f.write(basic_example_content)
-    print("   ✅ Created: examples/basic_usage.py")
 
-    # Scientific calculator example
-    scientific_example_content = f'''#!/usr/bin/env python3
+# examples/scientific_usage.py, split the same way
+_SCIENTIFIC_EXAMPLE_PARTS = '''#!/usr/bin/env python3
 """
 Scientific Calculator Usage Example
 
-This example demonstrates the scientific functionality of the {package_name} package.
+This example demonstrates the scientific functionality of the ${package_name} package.
 """
 
 import math
-from {package_name} import ScientificCalculator, format_result
+from ${package_name} import ScientificCalculator, format_result
 
 def main():
     print("=== Scientific Calculator Example ===\\n")
@@ -1216,45 +1376,45 @@ def main():
 
     # Using radians
     sin_pi_2 = calc.sin(math.pi / 2)
-    print(f"sin(π/2) = {{format_result(sin_pi_2, 6)}}")
+    print(f"sin(π/2) = {format_result(sin_pi_2, 6)}")
 
     cos_0 = calc.cos(0)
-    print(f"cos(0) = {{format_result(cos_0, 6)}}")
+    print(f"cos(0) = {format_result(cos_0, 6)}")
 
     # Using degrees
     sin_90 = calc.sin(90, degrees=True)
-    print(f"sin(90°) = {{format_result(sin_90, 6)}}")
+    print(f"sin(90°) = {format_result(sin_90, 6)}")
 
     tan_45 = calc.tan(45, degrees=True)
-    print(f"tan(45°) = {{format_result(tan_45, 6)}}")
+    print(f"tan(45°) = {format_result(tan_45, 6)}")
 
     # Logarithmic functions
     print("\\nLogarithmic functions:")
 
     ln_e = calc.log(math.e)
-    print(f"ln(e) = {{format_result(ln_e, 6)}}")
+    print(f"ln(e) = {format_result(ln_e, 6)}")
 
     log10_100 = calc.log(100, 10)
-    print(f"log₁₀(100) = {{format_result(log10_100, 6)}}")
+    print(f"log₁₀(100) = {format_result(log10_100, 6)}")
 
     log2_8 = calc.log(8, 2)
-    print(f"log₂(8) = {{format_result(log2_8, 6)}}")
+    print(f"log₂(8) = {format_result(log2_8, 6)}")
 
     # Square roots
     print("\\nSquare roots:")
     sqrt_16 = calc.sqrt(16)
-    print(f"√16 = {{format_result(sqrt_16, 6)}}")
+    print(f"√16 = {format_result(sqrt_16, 6)}")
 
     sqrt_2 = calc.sqrt(2)
-    print(f"√2 = {{format_result(sqrt_2, 6)}}")
+    print(f"√2 = {format_result(sqrt_2, 6)}")
 
     # Factorials
     print("\\nFactorials:")
     fact_5 = calc.factorial(5)
-    print(f"5! = {{fact_5}}")
+    print(f"5! = {fact_5}")
 
     fact_10 = calc.factorial(10)
-    print(f"10! = {{fact_10:,}}")
+    print(f"10! = {fact_10:,}")
 
     # Combined operations (scientific calculator also has basic operations)
     print("\\nCombined operations:")
@@ -1262,285 +1422,351 @@ def main():
     # Calculate area of circle: A = π * r²
     radius = 5
     area = calc.multiply(math.pi, calc.power(radius, 2))
-    print(f"Area of circle (r={{radius}}): {{format_result(area, 2)}}")
+    print(f"Area of circle (r={radius}): {format_result(area, 2)}")
 
     # Calculate hypotenuse: c = √(a² + b²)
     a, b = 3, 4
     c_squared = calc.add(calc.power(a, 2), calc.power(b, 2))
     hypotenuse = calc.sqrt(c_squared)
-    print(f"Hypotenuse of triangle ({{a}}, {{b}}): {{format_result(hypotenuse, 2)}}")
+    print(f"Hypotenuse of triangle ({a}, {b}): {format_result(hypotenuse, 2)}")
 
     # Calculation history
     print("\\nCalculation history (last 10):")
     history = calc.get_history()
     for i, calculation in enumerate(history[-10:], 1):
-        print(f"{{i:2}}. {{calculation}}")
+        print(f"{i:2}. {calculation}")
 
     print("\\n=== Scientific example completed ===")
 
 if __name__ == "__main__":
     main()
-'''
+'''.encode("utf-8").split(b"${package_name}")
+
+
+@functools.lru_cache(maxsize=8)
+def _render_scientific_example(package_name: str) -> bytes:
+    """Return examples/scientific_usage.py rendered for package_name"""
+    return package_name.encode("utf-8").join(_SCIENTIFIC_EXAMPLE_PARTS)
+
+
+def create_example_files(base_dir: Path, package_name: str) -> list:
+    """Return (path, bytes) entries for example files"""
+
+    # The bodies only depend on package_name, so they are rendered once
+    examples_dir = base_dir / "examples"
+    return [
+        (examples_dir / "basic_usage.py", _render_basic_example(package_name)),
+        (examples_dir / "scientific_usage.py", _render_scientific_example(package_name)),
+    ]
+
+
+# Every file group in reporting order, as (progress title, whether paths are
+# shown relative to the package rather than the project root, builder)
+_SECTION_BUILDERS = (
+    ("2. Creating package files:", True, create_module_files),
+    ("3. Creating setup and configuration files:", False, create_setup_files),
+    ("4. Creating test files:", False, create_test_files),
+    ("5. Creating documentation files:", False, create_documentation_files),
+    ("6. Creating example files:", False, create_example_files),
+)
+
+
+# The demonstrate_* sections below are fixed reference text, so each one is
+# a single constant written with one stdout call instead of ~100 prints
+_PACKAGING_DOC = """
+============================================================
+PACKAGING AND DISTRIBUTION COMMANDS
+============================================================
+
+1. Setting up development environment:
+   # Create virtual environment
+   python -m venv venv
+   source venv/bin/activate  # Linux/Mac
+   venv\\Scripts\\activate     # Windows
+
+   # Install development dependencies
+   pip install -e '.[dev]'
+
+2. Testing your package:
+   # Run tests
+   pytest
+
+   # Run tests with coverage
+   pytest --cov=awesome_calculator --cov-report=html
+
+   # Type checking
+   mypy awesome_calculator/
+
+3. Code quality:
+   # Format code
+   black awesome_calculator/ tests/
+
+   # Sort imports
+   isort awesome_calculator/ tests/
 
-    with open(examples_dir / "scientific_usage.py", "w") as f:
-        f.write(scientific_example_content)
-    print("   ✅ Created: examples/scientific_usage.py")
+   # Linting
+   flake8 awesome_calculator/
+
+4. Building the package:
+   # Install build tools
+   pip install build twine
+
+   # Clean previous builds
+   rm -rf build/ dist/ *.egg-info/
+
+   # Build package
+   python -m build
+
+   # This creates:
+   # dist/awesome_calculator-1.0.0.tar.gz (source distribution)
+   # dist/awesome_calculator-1.0.0-py3-none-any.whl (wheel)
+
+5. Testing the built package:
+   # Install from wheel
+   pip install dist/awesome_calculator-1.0.0-py3-none-any.whl
+
+   # Test import
+   python -c "import awesome_calculator; print('Success!')"
+
+6. Uploading to PyPI:
+   # Check package
+   twine check dist/*
+
+   # Upload to Test PyPI first
+   twine upload --repository testpypi dist/*
+
+   # Test installation from Test PyPI
+   pip install --index-url https://test.pypi.org/simple/ awesome-calculator
+
+   # Upload to real PyPI
+   twine upload dist/*
+
+7. Local installation methods:
+   # Install in editable/development mode
+   pip install -e .
+
+   # Install from local directory
+   pip install /path/to/package/
+
+   # Install from git repository
+   pip install git+https://github.com/user/repo.git
+
+8. Version management:
+   # Update version in setup.py or pyproject.toml
+   # Create git tag
+   git tag v1.0.1
+   git push origin v1.0.1
+
+   # Or use bumpversion tool
+   pip install bumpversion
+   bumpversion patch  # 1.0.0 -> 1.0.1
+   bumpversion minor  # 1.0.1 -> 1.1.0
+   bumpversion major  # 1.1.0 -> 2.0.0
+"""
 
 
 def demonstrate_packaging_commands():
     """Demonstrate packaging and distribution commands"""
-    print("\n" + "=" * 60)
-    print("PACKAGING AND DISTRIBUTION COMMANDS")
-    print("=" * 60)
+    sys.stdout.write(_PACKAGING_DOC)
+    sys.stdout.flush()
+
+
+_VENV_DOC = """
+============================================================
+VIRTUAL ENVIRONMENTS
+============================================================
+
+1. Why use virtual environments?
+   - Isolate project dependencies
+   - Avoid version conflicts
+   - Reproducible development environments
+   - Clean project deployments
+
+2. Creating virtual environments:
+   # Using venv (Python 3.3+)
+   python -m venv myproject_env
+   python -m venv venv  # Common name
+
+   # Using virtualenv (older method)
+   pip install virtualenv
+   virtualenv myproject_env
+
+   # Using conda
+   conda create --name myproject python=3.11
+
+3. Activating virtual environments:
+   # Linux/Mac
+   source venv/bin/activate
+
+   # Windows
+   venv\\Scripts\\activate
+   # or
+   venv\\Scripts\\activate.bat
+
+   # Conda
+   conda activate myproject
+
+4. Working with virtual environments:
+   # Check which Python you're using
+   which python
+   python --version
+
+   # Install packages
+   pip install requests pandas
+
+   # List installed packages
+   pip list
+   pip freeze
+
+   # Save requirements
+   pip freeze > requirements.txt
+
+   # Install from requirements
+   pip install -r requirements.txt
 
-    print("\\n1. Setting up development environment:")
-    print("   # Create virtual environment")
-    print("   python -m venv venv")
-    print("   source venv/bin/activate  # Linux/Mac")
-    print("   venv\\\\Scripts\\\\activate     # Windows")
-    print("")
-    print("   # Install development dependencies")
-    print("   pip install -e '.[dev]'")
-
-    print("\\n2. Testing your package:")
-    print("   # Run tests")
-    print("   pytest")
-    print("")
-    print("   # Run tests with coverage")
-    print("   pytest --cov=awesome_calculator --cov-report=html")
-    print("")
-    print("   # Type checking")
-    print("   mypy awesome_calculator/")
-
-    print("\\n3. Code quality:")
-    print("   # Format code")
-    print("   black awesome_calculator/ tests/")
-    print("")
-    print("   # Sort imports")
-    print("   isort awesome_calculator/ tests/")
-    print("")
-    print("   # Linting")
-    print("   flake8 awesome_calculator/")
-
-    print("\\n4. Building the package:")
-    print("   # Install build tools")
-    print("   pip install build twine")
-    print("")
-    print("   # Clean previous builds")
-    print("   rm -rf build/ dist/ *.egg-info/")
-    print("")
-    print("   # Build package")
-    print("   python -m build")
-    print("")
-    print("   # This creates:")
-    print("   # dist/awesome_calculator-1.0.0.tar.gz (source distribution)")
-    print("   # dist/awesome_calculator-1.0.0-py3-none-any.whl (wheel)")
-
-    print("\\n5. Testing the built package:")
-    print("   # Install from wheel")
-    print("   pip install dist/awesome_calculator-1.0.0-py3-none-any.whl")
-    print("")
-    print("   # Test import")
-    print("   python -c \\"import awesome_calculator; print('Success!')\\"")
-
-    print("\\n6. Uploading to PyPI:")
-    print("   # Check package")
-    print("   twine check dist/*")
-    print("")
-    print("   # Upload to Test PyPI first")
-    print("   twine upload --repository testpypi dist/*")
-    print("")
-    print("   # Test installation from Test PyPI")
-    print("   pip install --index-url https://test.pypi.org/simple/ awesome-calculator")
-    print("")
-    print("   # Upload to real PyPI")
-    print("   twine upload dist/*")
-
-    print("\\n7. Local installation methods:")
-    print("   # Install in editable/development mode")
-    print("   pip install -e .")
-    print("")
-    print("   # Install from local directory")
-    print("   pip install /path/to/package/")
-    print("")
-    print("   # Install from git repository")
-    print("   pip install git+https://github.com/user/repo.git")
-
-    print("\\n8. Version management:")
-    print("   # Update version in setup.py or pyproject.toml")
-    print("   # Create git tag")
-    print("   git tag v1.0.1")
-    print("   git push origin v1.0.1")
-    print("")
-    print("   # Or use bumpversion tool")
-    print("   pip install bumpversion")
-    print("   bumpversion patch  # 1.0.0 -> 1.0.1")
-    print("   bumpversion minor  # 1.0.1 -> 1.1.0")
-    print("   bumpversion major  # 1.1.0 -> 2.0.0")
+5. Deactivating virtual environments:
+   # For venv and virtualenv
+   deactivate
+
+   # For conda
+   conda deactivate
+
+6. Managing multiple environments:
+   # List conda environments
+   conda env list
+
+   # Remove conda environment
+   conda env remove --name myproject
+
+   # Export conda environment
+   conda env export > environment.yml
+
+   # Create from environment file
+   conda env create -f environment.yml
+
+7. Best practices:
+   - Always use virtual environments for projects
+   - Use descriptive names for environments
+   - Keep requirements.txt updated
+   - Don't commit virtual environment folders to git
+   - Use .gitignore to exclude venv/, .env/, etc.
+"""
 
 
 def demonstrate_virtual_environments():
     """Demonstrate virtual environment usage"""
-    print("\\n" + "=" * 60)
-    print("VIRTUAL ENVIRONMENTS")
-    print("=" * 60)
+    sys.stdout.write(_VENV_DOC)
+    sys.stdout.flush()
+
+
+_DEPS_DOC = """
+============================================================
+DEPENDENCY MANAGEMENT
+============================================================
+
+1. Requirements files:
+   # Basic requirements.txt
+   requests>=2.28.0
+   click>=8.0.0
+   pandas>=1.5.0,<2.0.0
+
+   # Development requirements (requirements-dev.txt)
+   pytest>=7.0.0
+   black>=22.0.0
+   mypy>=1.0.0
+
+   # Install requirements
+   pip install -r requirements.txt
+   pip install -r requirements-dev.txt
+
+2. Setup.py dependencies:
+   setup(
+       install_requires=[
+           'requests>=2.28.0',
+           'click>=8.0.0',
+       ],
+       extras_require={
+           'dev': ['pytest>=7.0', 'black>=22.0'],
+           'docs': ['sphinx>=5.0'],
+       }
+   )
+
+   # Install with extras
+   pip install .[dev]
+   pip install .[dev,docs]
+
+3. Modern dependency management (pipenv):
+   # Install pipenv
+   pip install pipenv
 
-    print("\\n1. Why use virtual environments?")
-    print("   - Isolate project dependencies")
-    print("   - Avoid version conflicts")
-    print("   - Reproducible development environments")
-    print("   - Clean project deployments")
-
-    print("\\n2. Creating virtual environments:")
-    print("   # Using venv (Python 3.3+)")
-    print("   python -m venv myproject_env")
-    print("   python -m venv venv  # Common name")
-    print("")
-    print("   # Using virtualenv (older method)")
-    print("   pip install virtualenv")
-    print("   virtualenv myproject_env")
-    print("")
-    print("   # Using conda")
-    print("   conda create --name myproject python=3.11")
-
-    print("\\n3. Activating virtual environments:")
-    print("   # Linux/Mac")
-    print("   source venv/bin/activate")
-    print("")
-    print("   # Windows")
-    print("   venv\\\\Scripts\\\\activate")
-    print("   # or")
-    print("   venv\\\\Scripts\\\\activate.bat")
-    print("")
-    print("   # Conda")
-    print("   conda activate myproject")
-
-    print("\\n4. Working with virtual environments:")
-    print("   # Check which Python you're using")
-    print("   which python")
-    print("   python --version")
-    print("")
-    print("   # Install packages")
-    print("   pip install requests pandas")
-    print("")
-    print("   # List installed packages")
-    print("   pip list")
-    print("   pip freeze")
-    print("")
-    print("   # Save requirements")
-    print("   pip freeze > requirements.txt")
-    print("")
-    print("   # Install from requirements")
-    print("   pip install -r requirements.txt")
-
-    print("\\n5. Deactivating virtual environments:")
-    print("   # For venv and virtualenv")
-    print("   deactivate")
-    print("")
-    print("   # For conda")
-    print("   conda deactivate")
-
-    print("\\n6. Managing multiple environments:")
-    print("   # List conda environments")
-    print("   conda env list")
-    print("")
-    print("   # Remove conda environment")
-    print("   conda env remove --name myproject")
-    print("")
-    print("   # Export conda environment")
-    print("   conda env export > environment.yml")
-    print("")
-    print("   # Create from environment file")
-    print("   conda env create -f environment.yml")
-
-    print("\\n7. Best practices:")
-    print("   - Always use virtual environments for projects")
-    print("   - Use descriptive names for environments")
-    print("   - Keep requirements.txt updated")
-    print("   - Don't commit virtual environment folders to git")
-    print("   - Use .gitignore to exclude venv/, .env/, etc.")
+   # Initialize project
+   pipenv install
+
+   # Install packages
+   pipenv install requests
+   pipenv install pytest --dev
+
+   # Generate requirements.txt
+   pipenv requirements > requirements.txt
+
+4. Poetry (modern dependency management):
+   # Install poetry
+   pip install poetry
+
+   # Initialize project
+   poetry init
+
+   # Add dependencies
+   poetry add requests
+   poetry add pytest --group dev
+
+   # Install dependencies
+   poetry install
+
+5. Version specifiers:
+   # Exact version
+   package==1.2.3
+
+   # Minimum version
+   package>=1.2.3
+
+   # Compatible release
+   package~=1.2.3  # >=1.2.3, <1.3.0
+
+   # Version range
+   package>=1.2.0,<2.0.0
+
+   # Exclude versions
+   package>=1.2.0,!=1.3.0
+"""
 
 
 def demonstrate_dependency_management():
     """Demonstrate dependency management"""
-    print("\\n" + "=" * 60)
-    print("DEPENDENCY MANAGEMENT")
-    print("=" * 60)
-
-    print("\\n1. Requirements files:")
-    print("   # Basic requirements.txt")
-    print("   requests>=2.28.0")
-    print("   click>=8.0.0")
-    print("   pandas>=1.5.0,<2.0.0")
-    print("")
-    print("   # Development requirements (requirements-dev.txt)")
-    print("   pytest>=7.0.0")
-    print("   black>=22.0.0")
-    print("   mypy>=1.0.0")
-    print("")
-    print("   # Install requirements")
-    print("   pip install -r requirements.txt")
-    print("   pip install -r requirements-dev.txt")
-
-    print("\\n2. Setup.py dependencies:")
-    print("   setup(")
-    print("       install_requires=[")
-    print("           'requests>=2.28.0',")
-    print("           'click>=8.0.0',")
-    print("       ],")
-    print("       extras_require={")
-    print("           'dev': ['pytest>=7.0', 'black>=22.0'],")
-    print("           'docs': ['sphinx>=5.0'],")
-    print("       }")
-    print("   )")
-    print("")
-    print("   # Install with extras")
-    print("   pip install .[dev]")
-    print("   pip install .[dev,docs]")
-
-    print("\\n3. Modern dependency management (pipenv):")
-    print("   # Install pipenv")
-    print("   pip install pipenv")
-    print("")
-    print("   # Initialize project")
-    print("   pipenv install")
-    print("")
-    print("   # Install packages")
-    print("   pipenv install requests")
-    print("   pipenv install pytest --dev")
-    print("")
-    print("   # Generate requirements.txt")
-    print("   pipenv requirements > requirements.txt")
-
-    print("\\n4. Poetry (modern dependency management):")
-    print("   # Install poetry")
-    print("   pip install poetry")
-    print("")
-    print("   # Initialize project")
-    print("   poetry init")
-    print("")
-    print("   # Add dependencies")
-    print("   poetry add requests")
-    print("   poetry add pytest --group dev")
-    print("")
-    print("   # Install dependencies")
-    print("   poetry install")
-
-    print("\\n5. Version specifiers:")
-    print("   # Exact version")
-    print("   package==1.2.3")
-    print("")
-    print("   # Minimum version")
-    print("   package>=1.2.3")
-    print("")
-    print("   # Compatible release")
-    print("   package~=1.2.3  # >=1.2.3, <1.3.0")
-    print("")
-    print("   # Version range")
-    print("   package>=1.2.0,<2.0.0")
-    print("")
-    print("   # Exclude versions")
-    print("   package>=1.2.0,!=1.3.0")
+    sys.stdout.write(_DEPS_DOC)
+    sys.stdout.flush()
+
+
+def _walk(path, depth: int = 0):
+    """Yield (depth, name, is_dir) for the tree under path
+
+    Entries come from os.scandir, whose d_type lets is_dir() answer
+    without a stat() per entry. Within a directory, files are listed
+    before subdirectories (as os.walk would print them) and names are
+    sorted. __pycache__ and *.pyc are skipped.
+    """
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir():
+            if entry.name != "__pycache__":
+                subdirs.append(entry)
+        elif not entry.name.endswith(".pyc"):
+            yield depth, entry.name, False
+    for entry in subdirs:
+        yield depth, entry.name, True
+        yield from _walk(entry.path, depth + 1)
 
 
 def main():
@@ -1552,32 +1778,24 @@ def main():
     package_dir = create_sample_package_structure()
 
     if package_dir:
-        print(f"\\n✅ Sample package created at: {package_dir.absolute()}")
-
-        # Show final directory structure
-        print("\\nFinal package structure:")
-        for root, dirs, files in os.walk(package_dir):
-            # Skip __pycache__ directories
-            dirs[:] = [d for d in dirs if d != '__pycache__']
-
-            level = root.replace(str(package_dir), '').count(os.sep)
-            indent = '  ' * level
-            print(f"{indent}{os.path.basename(root)}/")
-            subindent = '  ' * (level + 1)
-            for file in files:
-                if not file.endswith('.pyc'):
-                    print(f"{subindent}{file}")
+        print(f"\n✅ Sample package created at: {package_dir.absolute()}")
+
+        # Show final directory structure, collected into one buffer
+        lines = ["\nFinal package structure:", f"{package_dir.name}/"]
+        for depth, name, is_dir in _walk(package_dir):
+            lines.append(f"{'  ' * (depth + 1)}{name}{'/' if is_dir else ''}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Demonstrate commands and concepts
     demonstrate_packaging_commands()
     demonstrate_virtual_environments()
     demonstrate_dependency_management()
 
-    print("\\n" + "=" * 60)
+    print("\n" + "=" * 60)
     print("PYTHON PACKAGING TUTORIAL COMPLETED!")
     print("=" * 60)
 
-    print("\\n💡 Key Packaging Concepts:")
+    print("\n💡 Key Packaging Concepts:")
     print("- Package structure with __init__.py files")
     print("- setup.py and pyproject.toml configuration")
     print("- Version management and semantic versioning")
@@ -1586,7 +1804,7 @@ def main():
     print("- Building distributions (sdist and wheel)")
     print("- Publishing to PyPI")
 
-    print("\\n🛠️ Essential Tools:")
+    print("\n🛠️ Essential Tools:")
     print("- setuptools: Package building")
     print("- build: Modern build frontend")
     print("- twine: Package uploading")
@@ -1595,7 +1813,7 @@ def main():
     print("- mypy: Type checking")
     print("- venv: Virtual environments")
 
-    print("\\n📚 Next Steps:")
+    print("\n📚 Next Steps:")
     print("- Practice creating your own packages")
     print("- Learn about namespace packages")
     print("- Explore continuous integration (CI/CD)")
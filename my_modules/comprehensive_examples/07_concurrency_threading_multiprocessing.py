@@ -10,26 +10,114 @@ This module demonstrates the differences between threading and multiprocessing i
 - Performance analysis and best practices
 """
 
+import atexit
 import threading
 import multiprocessing
+import multiprocessing.pool
+from multiprocessing import shared_memory
 import time
 import os
 import sys
 import queue
 import concurrent.futures
 import asyncio
+import itertools
 from typing import List, Any, Callable, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import requests
 import json
 import math
+from array import array
+from decimal import Decimal
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Worker counts sized to the machine: I/O-bound pools use the same default
+# as ThreadPoolExecutor itself, CPU-bound pools one worker per CPU
+DEFAULT_IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+DEFAULT_CPU_WORKERS = os.cpu_count() or 1
 
 
 # ============================================================================
 # THREADING EXAMPLES
 # ============================================================================
 
+def drain_queue(q: queue.Queue) -> list:
+    """Remove and return everything in q under a single lock acquisition
+
+    Unlike looping on empty()/get(), which locks twice per item, this takes
+    a consistent snapshot of the queue in one step. Drained items count as
+    done, as if task_done() had been called for each, so q.join() still
+    returns once the remaining work is finished.
+    """
+    with q.mutex:
+        items = list(q.queue)
+        q.queue.clear()
+        q.not_full.notify_all()  # Wake producers blocked on a full queue
+        if items:
+            q.unfinished_tasks -= len(items)
+            if q.unfinished_tasks == 0:
+                q.all_tasks_done.notify_all()
+    return items
+
+
+def write_thread_logs(logs: List[List[str]]):
+    """Print messages buffered by worker threads, one thread after another
+
+    Each print() takes stdout's lock, so workers printing as they go
+    serialize on it; collecting lines per thread and writing them all at
+    once after join() costs a single write.
+    """
+    sys.stdout.write("".join(f"{line}\n" for log in logs for line in log))
+
+
+class SPSCRing:
+    """Bounded ring buffer for exactly one producer and one consumer thread
+
+    queue.Queue serves any number of threads, so every put/get takes a lock
+    and signals a Condition. With a single producer and a single consumer,
+    each index has only one writer: the producer advances _tail, the
+    consumer advances _head, and neither needs a lock. A waiting side
+    yields with time.sleep(0) instead of blocking on a Condition.
+
+    This relies on the GIL: it keeps each store atomic and makes the
+    producer's slot write visible before its _tail update. On a
+    free-threaded (no-GIL) build nothing orders those two stores, so this
+    is a data race there; use queue.Queue instead.
+    """
+
+    def __init__(self, capacity: int):
+        # One slot always stays empty so that full and empty differ
+        self._buffer = [None] * (capacity + 1)
+        self._head = 0  # Next slot to read (consumer only)
+        self._tail = 0  # Next slot to write (producer only)
+
+    def put(self, item: Any):
+        """Append item, waiting while the ring is full (producer only)"""
+        next_tail = (self._tail + 1) % len(self._buffer)
+        while next_tail == self._head:
+            time.sleep(0)
+        self._buffer[self._tail] = item
+        self._tail = next_tail  # Publish only after the slot is written
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Remove the oldest item, waiting while empty (consumer only)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._head == self._tail:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise queue.Empty
+            time.sleep(0)
+        item = self._buffer[self._head]
+        self._buffer[self._head] = None
+        self._head = (self._head + 1) % len(self._buffer)
+        return item
+
+
 class ThreadExample:
     """Comprehensive threading examples"""
 
@@ -44,22 +132,24 @@ class ThreadExample:
         print("BASIC THREADING EXAMPLE")
         print("=" * 60)
 
-        def worker(thread_id: int, delay: float):
+        def worker(thread_id: int, delay: float, log: List[str]):
             """Worker function that simulates I/O-bound task"""
-            print(f"Thread {thread_id}: Starting work")
+            log.append(f"Thread {thread_id}: Starting work")
             time.sleep(delay)  # Simulate I/O operation
-            print(f"Thread {thread_id}: Completed work after {delay}s")
+            log.append(f"Thread {thread_id}: Completed work after {delay}s")
             return f"Result from thread {thread_id}"
 
         print("\\n1. Creating and starting threads:")
         threads = []
+        logs = []
         start_time = time.time()
 
         # Create and start threads
         for i in range(5):
+            logs.append([])
             thread = threading.Thread(
                 target=worker,
-                args=(i, i * 0.5 + 1),
+                args=(i, i * 0.5 + 1, logs[-1]),
                 name=f"Worker-{i}"
             )
             threads.append(thread)
@@ -71,6 +161,7 @@ class ThreadExample:
             thread.join()
 
         end_time = time.time()
+        write_thread_logs(logs)
         print(f"\\n✅ All threads completed in {end_time - start_time:.2f} seconds")
         print(f"Active threads: {threading.active_count()}")
 
@@ -80,7 +171,7 @@ class ThreadExample:
         print("THREADING WITH RETURN VALUES")
         print("=" * 60)
 
-        def fetch_data(thread_id: int, result_queue: queue.Queue):
+        def fetch_data(thread_id: int, result_queue: queue.Queue, log: List[str]):
             """Simulate fetching data from external source"""
             delay = thread_id * 0.3 + 0.5
             time.sleep(delay)  # Simulate network delay
@@ -92,26 +183,27 @@ class ThreadExample:
                 "timestamp": datetime.now().isoformat()
             }
             result_queue.put(data)
-            print(f"Thread {thread_id}: Data fetched in {delay:.1f}s")
+            log.append(f"Thread {thread_id}: Data fetched in {delay:.1f}s")
 
         print("\\n1. Using Queue to collect results:")
         result_queue = queue.Queue()
         threads = []
+        logs = []
 
         # Start threads
         for i in range(4):
-            thread = threading.Thread(target=fetch_data, args=(i, result_queue))
+            logs.append([])
+            thread = threading.Thread(target=fetch_data, args=(i, result_queue, logs[-1]))
             threads.append(thread)
             thread.start()
 
         # Wait for completion
         for thread in threads:
             thread.join()
+        write_thread_logs(logs)
 
         # Collect results
-        results = []
-        while not result_queue.empty():
-            results.append(result_queue.get())
+        results = drain_queue(result_queue)
 
         print("\\n2. Results collected:")
         for result in sorted(results, key=lambda x: x['thread_id']):
@@ -125,6 +217,13 @@ class ThreadExample:
         print("THREAD SYNCHRONIZATION")
         print("=" * 60)
 
+        # Work is simulated with a short CPU-only spin rather than a sleep:
+        # a sleep is a syscall plus a GIL hand-off per iteration, with a
+        # ~100µs floor. Enough iterations outlast the interpreter's 5ms
+        # thread switch interval, so the race still shows up in milliseconds
+        iterations = 100_000
+        expected = 3 * iterations
+
         print("\\n1. Without synchronization (race condition):")
         shared_counter = {"value": 0}
 
@@ -132,44 +231,48 @@ class ThreadExample:
             """Unsafe increment without lock"""
             for _ in range(iterations):
                 current = counter["value"]
-                time.sleep(0.0001)  # Simulate some processing
+                for _ in range(10):  # Simulate some processing
+                    pass
                 counter["value"] = current + 1
 
         # Unsafe version
         threads = []
         for i in range(3):
-            thread = threading.Thread(target=increment_unsafe, args=(shared_counter, 100))
+            thread = threading.Thread(target=increment_unsafe, args=(shared_counter, iterations))
             threads.append(thread)
             thread.start()
 
         for thread in threads:
             thread.join()
 
-        print(f"   Expected: 300, Got: {shared_counter['value']} (likely less due to race condition)")
+        print(f"   Expected: {expected}, Got: {shared_counter['value']} (likely less due to race condition)")
 
         print("\\n2. With synchronization (thread-safe):")
-        safe_counter = {"value": 0}
-        counter_lock = threading.Lock()
-
-        def increment_safe(counter: dict, lock: threading.Lock, iterations: int):
-            """Safe increment with lock"""
+        # Sharded counter: each thread counts in a local variable and writes
+        # its own slot once at the end, so increments never touch shared
+        # state - nothing to lock and no memory contended between cores
+        safe_shards = [0] * 3
+
+        def increment_safe(shards: List[int], shard: int, iterations: int):
+            """Safe increment into a per-thread shard"""
+            count = 0
             for _ in range(iterations):
-                with lock:
-                    current = counter["value"]
-                    time.sleep(0.0001)  # Simulate processing
-                    counter["value"] = current + 1
+                for _ in range(10):  # Simulate processing
+                    pass
+                count += 1
+            shards[shard] = count
 
         # Safe version
         threads = []
         for i in range(3):
-            thread = threading.Thread(target=increment_safe, args=(safe_counter, counter_lock, 100))
+            thread = threading.Thread(target=increment_safe, args=(safe_shards, i, iterations))
             threads.append(thread)
             thread.start()
 
         for thread in threads:
             thread.join()
 
-        print(f"   Expected: 300, Got: {safe_counter['value']} ✅")
+        print(f"   Expected: {expected}, Got: {sum(safe_shards)} ✅")
 
     def producer_consumer_example(self):
         """Producer-Consumer pattern with threading"""
@@ -177,46 +280,60 @@ class ThreadExample:
         print("PRODUCER-CONSUMER PATTERN")
         print("=" * 60)
 
+        # Both queues carry lists of items rather than single items, so each
+        # put/get (and its lock + condition round trip) covers a whole batch
+        batch_size = 4
         task_queue = queue.Queue(maxsize=5)
         result_queue = queue.Queue()
 
-        def producer(name: str, num_items: int):
+        def producer(name: str, num_items: int, log: List[str]):
             """Produce tasks"""
+            batch = []
             for i in range(num_items):
                 task = f"Task-{i}-from-{name}"
-                task_queue.put(task)
-                print(f"Producer {name}: Created {task}")
+                batch.append(task)
+                log.append(f"Producer {name}: Created {task}")
+                if len(batch) == batch_size:
+                    task_queue.put(batch)
+                    batch = []
                 time.sleep(0.2)
-            print(f"Producer {name}: Finished producing {num_items} tasks")
+            if batch:
+                task_queue.put(batch)
+            log.append(f"Producer {name}: Finished producing {num_items} tasks")
 
-        def consumer(name: str):
+        def consumer(name: str, log: List[str]):
             """Consume tasks"""
             while True:
-                try:
-                    task = task_queue.get(timeout=2)
-                    print(f"Consumer {name}: Processing {task}")
-                    time.sleep(0.5)  # Simulate processing
-                    result = f"Processed-{task}"
-                    result_queue.put(result)
+                batch = task_queue.get()
+                if batch is None:  # Sentinel: producers are done
                     task_queue.task_done()
-                    print(f"Consumer {name}: Completed {task}")
-                except queue.Empty:
-                    print(f"Consumer {name}: No more tasks, shutting down")
+                    log.append(f"Consumer {name}: No more tasks, shutting down")
                     break
+                results = []
+                for task in batch:
+                    log.append(f"Consumer {name}: Processing {task}")
+                    time.sleep(0.5)  # Simulate processing
+                    results.append(f"Processed-{task}")
+                    log.append(f"Consumer {name}: Completed {task}")
+                result_queue.put(results)
+                task_queue.task_done()
 
         print("\\n1. Starting producers and consumers:")
 
         # Start producers
+        logs = []
         producer_threads = []
         for i in range(2):
-            thread = threading.Thread(target=producer, args=(f"P{i}", 3))
+            logs.append([])
+            thread = threading.Thread(target=producer, args=(f"P{i}", 3, logs[-1]))
             producer_threads.append(thread)
             thread.start()
 
         # Start consumers
         consumer_threads = []
         for i in range(2):
-            thread = threading.Thread(target=consumer, args=(f"C{i}"))
+            logs.append([])
+            thread = threading.Thread(target=consumer, args=(f"C{i}", logs[-1]))
             consumer_threads.append(thread)
             thread.start()
 
@@ -224,22 +341,50 @@ class ThreadExample:
         for thread in producer_threads:
             thread.join()
 
+        # One sentinel per consumer, queued behind the last real batch, so
+        # consumers stop as soon as the work runs out instead of timing out
+        for _ in consumer_threads:
+            task_queue.put(None)
+
         # Wait for all tasks to be processed
         task_queue.join()
 
         # Wait for consumers to finish
         for thread in consumer_threads:
             thread.join()
+        write_thread_logs(logs)
 
         print("\\n2. Collecting results:")
-        results = []
-        while not result_queue.empty():
-            results.append(result_queue.get())
+        results = [result for batch in drain_queue(result_queue) for result in batch]
 
         print(f"   Total results: {len(results)}")
         for result in results[:3]:  # Show first 3
             print(f"   - {result}")
 
+        print("\\n3. One producer, one consumer: lock-free ring buffer:")
+        ring = SPSCRing(capacity=5)
+        ring_results = []
+
+        def ring_producer(num_items: int):
+            for i in range(num_items):
+                ring.put(f"Task-{i}")
+            ring.put(None)  # Sentinel: no more tasks
+
+        def ring_consumer():
+            # No timeout: the producer always ends with a sentinel
+            while (task := ring.get()) is not None:
+                ring_results.append(f"Processed-{task}")
+
+        ring_threads = [threading.Thread(target=ring_producer, args=(8,)),
+                        threading.Thread(target=ring_consumer)]
+        for thread in ring_threads:
+            thread.start()
+        for thread in ring_threads:
+            thread.join()
+
+        print(f"   Total results: {len(ring_results)}, in order: "
+              f"{ring_results == [f'Processed-Task-{i}' for i in range(8)]}")
+
 
 # ============================================================================
 # MULTIPROCESSING EXAMPLES
@@ -248,29 +393,60 @@ class ThreadExample:
 class MultiprocessingExample:
     """Comprehensive multiprocessing examples"""
 
+    def __init__(self):
+        self._pool = None
+
+    def _get_pool(self) -> multiprocessing.pool.Pool:
+        """Worker pool shared by the examples, started on first use
+
+        Starting a worker process costs far more than handing it a task,
+        so one pool sized to the machine serves every call.
+        """
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(processes=DEFAULT_CPU_WORKERS)
+            atexit.register(self.close)
+        return self._pool
+
+    def close(self):
+        """Shut down the shared worker pool, if it was started"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
     @staticmethod
     def cpu_intensive_task(n: int) -> dict:
         """CPU-intensive task for multiprocessing demo"""
         start_time = time.time()
 
-        # Calculate prime numbers up to n (CPU-intensive)
-        def is_prime(num):
-            if num < 2:
-                return False
-            for i in range(2, int(num ** 0.5) + 1):
-                if num % i == 0:
-                    return False
-            return True
-
-        primes = [i for i in range(2, n + 1) if is_prime(i)]
+        # Sieve of Eratosthenes up to n: each slice assignment strikes out
+        # all multiples of a prime in one C-level loop, instead of
+        # trial-dividing every number in Python bytecode
+        if NUMPY_AVAILABLE:
+            sieve = np.ones(n + 1, dtype=bool)
+            sieve[:2] = False
+            for i in range(2, math.isqrt(n) + 1):
+                if sieve[i]:
+                    sieve[i * i::i] = False
+            primes = np.flatnonzero(sieve)
+            primes_found = int(primes.size)
+            first_few_primes = primes[:10].tolist()
+        else:
+            sieve = bytearray([1]) * (n + 1)
+            sieve[:2] = bytes(min(2, n + 1))
+            for i in range(2, math.isqrt(n) + 1):
+                if sieve[i]:
+                    sieve[i * i::i] = bytes(len(range(i * i, n + 1, i)))
+            primes_found = sieve.count(1)
+            first_few_primes = list(itertools.islice(itertools.compress(range(n + 1), sieve), 10))
 
         end_time = time.time()
 
         return {
             "process_id": os.getpid(),
             "range": n,
-            "primes_found": len(primes),
-            "first_few_primes": primes[:10],
+            "primes_found": primes_found,
+            "first_few_primes": first_few_primes,
             "execution_time": end_time - start_time
         }
 
@@ -300,16 +476,20 @@ class MultiprocessingExample:
         print("\\n3. Parallel processing:")
         start_time = time.time()
 
-        with multiprocessing.Pool(processes=4) as pool:
-            parallel_results = pool.map(self.cpu_intensive_task, ranges)
-
-        parallel_time = time.time() - start_time
+        # imap_unordered yields each result as soon as any worker finishes
+        # it; a chunk of several tasks travels to a worker in one message
+        chunksize = max(1, len(ranges) // (4 * DEFAULT_CPU_WORKERS))
+        parallel_results = []
 
         print("   Parallel results:")
-        for result in parallel_results:
+        for result in self._get_pool().imap_unordered(self.cpu_intensive_task, ranges,
+                                                      chunksize=chunksize):
+            parallel_results.append(result)
             print(f"   Process {result['process_id']}: Range {result['range']}, "
                   f"{result['primes_found']} primes in {result['execution_time']:.2f}s")
 
+        parallel_time = time.time() - start_time
+
         print(f"   Parallel total time: {parallel_time:.2f}s")
         print(f"   ⚡ Speedup: {sequential_time / parallel_time:.2f}x")
 
@@ -321,12 +501,12 @@ class MultiprocessingExample:
 
         print("\\n1. Using Queue for communication:")
 
-        def worker_with_queue(worker_id: int, input_queue: multiprocessing.Queue,
-                            output_queue: multiprocessing.Queue):
+        def worker_with_queue(worker_id: int, input_queue: multiprocessing.SimpleQueue,
+                            output_queue: multiprocessing.SimpleQueue):
             """Worker that processes data from queue"""
             while True:
                 try:
-                    data = input_queue.get(timeout=2)
+                    data = input_queue.get()
                     if data is None:  # Sentinel value to stop
                         break
 
@@ -346,9 +526,11 @@ class MultiprocessingExample:
                     print(f"   Worker {worker_id}: Error - {e}")
                     break
 
-        # Create queues
-        input_queue = multiprocessing.Queue()
-        output_queue = multiprocessing.Queue()
+        # Create queues. SimpleQueue writes straight to its pipe under one
+        # lock; Queue adds a feeder thread and more locking per item, which
+        # only pays off for timeouts, maxsize or join_thread()
+        input_queue = multiprocessing.SimpleQueue()
+        output_queue = multiprocessing.SimpleQueue()
 
         # Add work to input queue
         work_items = [1, 4, 9, 16, 25, 36, 49, 64]
@@ -389,38 +571,60 @@ class MultiprocessingExample:
         print("SHARED MEMORY EXAMPLE")
         print("=" * 60)
 
-        def worker_shared_memory(shared_array: multiprocessing.Array,
-                               lock: multiprocessing.Lock, worker_id: int):
-            """Worker that modifies shared memory"""
-            with lock:
-                print(f"   Worker {worker_id} (PID {os.getpid()}): Accessing shared memory")
-                for i in range(len(shared_array)):
-                    shared_array[i] += worker_id
-                    time.sleep(0.1)  # Simulate work
-                print(f"   Worker {worker_id}: Updated shared array")
+        def worker_shared_memory(shm_name: str, length: int, worker_id: int, num_workers: int):
+            """Worker that modifies its own cells of shared memory"""
+            shm = shared_memory.SharedMemory(name=shm_name)
+            # Worker k owns cells k-1, k-1+num_workers, ...: no two workers
+            # write the same cell, so no lock is needed and they run in parallel
+            cells = slice(worker_id - 1, length, num_workers)
+            try:
+                # Unlocked workers print concurrently: one write per line keeps
+                # each line whole
+                sys.stdout.write(f"   Worker {worker_id} (PID {os.getpid()}): Accessing shared memory\n")
+                sys.stdout.flush()
+                if NUMPY_AVAILABLE:
+                    values = np.ndarray((length,), dtype=np.int64, buffer=shm.buf)
+                    values[cells] += worker_id  # One vectorized add in C
+                    del values  # Views must go before the segment is closed
+                else:
+                    with shm.buf.cast('q') as values:
+                        values[cells] = array('q', [value + worker_id for value in values[cells]])
+                time.sleep(0.1)  # Simulate work
+                sys.stdout.write(f"   Worker {worker_id}: Updated cells {list(range(length))[cells]}\n")
+                sys.stdout.flush()
+            finally:
+                shm.close()
 
         print("\\n1. Creating shared memory:")
-        # Create shared array
-        shared_array = multiprocessing.Array('i', [1, 2, 3, 4, 5])  # 'i' = integer
-        lock = multiprocessing.Lock()
-
-        print(f"   Initial array: {list(shared_array)}")
-
-        # Start processes that modify shared memory
-        processes = []
-        for i in range(3):
-            process = multiprocessing.Process(
-                target=worker_shared_memory,
-                args=(shared_array, lock, i + 1)
-            )
-            processes.append(process)
-            process.start()
-
-        # Wait for all processes
-        for process in processes:
-            process.join()
-
-        print(f"   Final array: {list(shared_array)}")
+        # Create a shared block of five int64 slots ('q' = signed 64-bit)
+        initial = [1, 2, 3, 4, 5]
+        shm = shared_memory.SharedMemory(create=True, size=len(initial) * 8)
+        num_workers = 3
+
+        try:
+            with shm.buf.cast('q') as values:
+                values[:] = array('q', initial)
+                print(f"   Initial array: {values.tolist()}")
+
+            # Start processes that modify shared memory; they attach by name
+            processes = []
+            for i in range(num_workers):
+                process = multiprocessing.Process(
+                    target=worker_shared_memory,
+                    args=(shm.name, len(initial), i + 1, num_workers)
+                )
+                processes.append(process)
+                process.start()
+
+            # Wait for all processes
+            for process in processes:
+                process.join()
+
+            with shm.buf.cast('q') as values:
+                print(f"   Final array: {values.tolist()}")
+        finally:
+            shm.close()
+            shm.unlink()
 
 
 # ============================================================================
@@ -430,15 +634,42 @@ class MultiprocessingExample:
 class ConcurrentFuturesExample:
     """High-level concurrency with concurrent.futures"""
 
+    def __init__(self):
+        self._process_executor = None
+
+    def _get_process_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Process pool shared by the examples, started on first use
+
+        Workers come from a forkserver where available: a small server
+        process forks each one, so they don't inherit (or copy on write)
+        this interpreter's whole heap the way plain fork does.
+        """
+        if self._process_executor is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context("forkserver")
+            else:
+                mp_context = None  # Platform default (spawn on Windows)
+            self._process_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=DEFAULT_CPU_WORKERS, mp_context=mp_context
+            )
+            atexit.register(self.close)
+        return self._process_executor
+
+    def close(self):
+        """Shut down the shared process pool, if it was started"""
+        if self._process_executor is not None:
+            self._process_executor.shutdown()
+            self._process_executor = None
+
     def thread_pool_executor_example(self):
         """ThreadPoolExecutor for I/O-bound tasks"""
         print("\\n" + "=" * 60)
         print("CONCURRENT.FUTURES - THREADPOOLEXECUTOR")
         print("=" * 60)
 
-        def fetch_url_simulation(url: str, delay: float) -> dict:
+        def fetch_url_simulation(url: str, delay: float, log: List[str]) -> dict:
             """Simulate fetching URL (I/O-bound)"""
-            print(f"   Fetching {url}...")
+            log.append(f"   Fetching {url}...")
             time.sleep(delay)  # Simulate network delay
             return {
                 "url": url,
@@ -458,11 +689,14 @@ class ConcurrentFuturesExample:
         print("\\n1. Using ThreadPoolExecutor:")
         start_time = time.time()
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        # One log per task: workers append to their own list instead of
+        # contending for stdout, and the logs are written once at the end
+        logs = [[] for _ in urls_and_delays]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DEFAULT_IO_WORKERS) as executor:
             # Submit tasks
             future_to_url = {
-                executor.submit(fetch_url_simulation, url, delay): url
-                for url, delay in urls_and_delays
+                executor.submit(fetch_url_simulation, url, delay, log): url
+                for (url, delay), log in zip(urls_and_delays, logs)
             }
 
             # Collect results as they complete
@@ -474,45 +708,79 @@ class ConcurrentFuturesExample:
                 except Exception as e:
                     print(f"   ❌ {url}: Error - {e}")
 
+        total_time = time.time() - start_time
+        print("\\n   Worker log:")
+        write_thread_logs(logs)
+        print(f"\\n   Total execution time: {total_time:.2f}s")
+
+        async def fetch_url_async(url: str, delay: float) -> dict:
+            """Simulate fetching URL without blocking a thread"""
+            print(f"   Fetching {url}...")
+            # Real code would await an aiohttp.ClientSession request here,
+            # sharing its connection pool across every fetch
+            await asyncio.sleep(delay)
+            return {
+                "url": url,
+                "status": 200,
+                "content_length": len(url) * 100,
+                "fetch_time": delay
+            }
+
+        async def fetch_all() -> list:
+            return await asyncio.gather(
+                *(fetch_url_async(url, delay) for url, delay in urls_and_delays)
+            )
+
+        print("\\n2. Using asyncio.gather (one thread, no pool):")
+        start_time = time.time()
+
+        # Every fetch waits concurrently on one event loop: no thread stacks
+        # and no cap of max_workers requests in flight
+        for result in asyncio.run(fetch_all()):
+            print(f"   ✅ {result['url']}: {result['status']} ({result['content_length']} bytes)")
+
         total_time = time.time() - start_time
         print(f"\\n   Total execution time: {total_time:.2f}s")
 
+    @staticmethod
+    def calculate_factorial(n: int) -> dict:
+        """CPU-intensive factorial calculation"""
+        start_time = time.time()
+
+        # C implementation with a divide-and-conquer product
+        result = math.factorial(n)
+        # Decimal gets at the digits without str(), which Python 3.11+
+        # refuses for ints over 4300 digits
+        digits = "".join(map(str, Decimal(result).as_tuple().digits))
+
+        return {
+            "input": n,
+            "factorial": digits[:50] + "..." if len(digits) > 50 else digits,
+            "process_id": os.getpid(),
+            "calculation_time": time.time() - start_time
+        }
+
     def process_pool_executor_example(self):
         """ProcessPoolExecutor for CPU-bound tasks"""
         print("\\n" + "=" * 60)
         print("CONCURRENT.FUTURES - PROCESSPOOLEXECUTOR")
         print("=" * 60)
 
-        def calculate_factorial(n: int) -> dict:
-            """CPU-intensive factorial calculation"""
-            start_time = time.time()
-
-            result = 1
-            for i in range(1, n + 1):
-                result *= i
-
-            return {
-                "input": n,
-                "factorial": str(result)[:50] + "..." if len(str(result)) > 50 else str(result),
-                "process_id": os.getpid(),
-                "calculation_time": time.time() - start_time
-            }
-
         numbers = [1000, 2000, 3000, 4000, 5000]
 
         print("\\n1. Using ProcessPoolExecutor:")
         start_time = time.time()
 
-        with concurrent.futures.ProcessPoolExecutor(max_workers=3) as executor:
-            # Submit all tasks
-            futures = [executor.submit(calculate_factorial, n) for n in numbers]
+        executor = self._get_process_executor()
+        # Submit all tasks
+        futures = [executor.submit(self.calculate_factorial, n) for n in numbers]
 
-            # Get results in order of completion
-            for future in concurrent.futures.as_completed(futures):
-                result = future.result()
-                print(f"   Process {result['process_id']}: "
-                      f"{result['input']}! = {result['factorial']} "
-                      f"({result['calculation_time']:.3f}s)")
+        # Get results in order of completion
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            print(f"   Process {result['process_id']}: "
+                  f"{result['input']}! = {result['factorial']} "
+                  f"({result['calculation_time']:.3f}s)")
 
         total_time = time.time() - start_time
         print(f"\\n   Total execution time: {total_time:.2f}s")
@@ -528,32 +796,100 @@ class ConcurrentFuturesExample:
             time.sleep(0.5)
             return data * data
 
+        # Done-callbacks run on the worker thread that finished the task, so
+        # they buffer their messages (list.append is atomic) for one write
+        callback_log = []
+
         def success_callback(future: concurrent.futures.Future):
             """Callback for successful completion"""
             result = future.result()
-            print(f"   ✅ Callback: Task completed with result {result}")
+            callback_log.append(f"   ✅ Callback: Task completed with result {result}")
 
         def error_callback(future: concurrent.futures.Future):
             """Callback for error handling"""
             exception = future.exception()
             if exception:
-                print(f"   ❌ Callback: Task failed with error {exception}")
+                callback_log.append(f"   ❌ Callback: Task failed with error {exception}")
 
         print("\\n1. Adding callbacks to futures:")
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DEFAULT_IO_WORKERS) as executor:
             for i in range(3):
                 future = executor.submit(process_data, i + 1)
                 future.add_done_callback(success_callback)
                 print(f"   Submitted task {i + 1}")
 
+        write_thread_logs([callback_log])
         print("\\n   All tasks completed with callbacks!")
 
+        print("\\n2. Awaiting executor futures from asyncio instead:")
+
+        async def consume_results(executor: concurrent.futures.Executor):
+            """Handle each result in the event loop as it completes"""
+            # A done-callback runs on the worker thread that finished the
+            # task; wrap_future hands completion to the event loop instead,
+            # so handling results never takes time away from the workers
+            futures = [asyncio.wrap_future(executor.submit(process_data, i + 1))
+                       for i in range(3)]
+            for next_done in asyncio.as_completed(futures):
+                print(f"   ✅ Awaited: Task completed with result {await next_done}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DEFAULT_IO_WORKERS) as executor:
+            asyncio.run(consume_results(executor))
+
 
 # ============================================================================
 # PERFORMANCE COMPARISON
 # ============================================================================
 
+def pin_worker_to_cpu(next_slot: multiprocessing.Value):
+    """Pool initializer: pin this worker process to a CPU of its own
+
+    Workers take consecutive slots from the shared counter, so each one is
+    kept on a different CPU (and its caches) instead of being moved around
+    by the scheduler. A no-op where sched_setaffinity doesn't exist.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpus = sorted(os.sched_getaffinity(0))
+    with next_slot.get_lock():
+        slot = next_slot.value
+        next_slot.value += 1
+    os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+
+
+def io_task(task_id: int) -> dict:
+    """Simulate I/O-bound task (module level so process pools can pickle it)"""
+    start = time.time()
+    time.sleep(0.5)  # Simulate I/O delay
+    return {
+        "task_id": task_id,
+        "duration": time.time() - start,
+        "process_id": os.getpid()
+    }
+
+
+def cpu_task(n: int) -> dict:
+    """CPU-intensive task (module level so process pools can pickle it)"""
+    start = time.time()
+
+    # Calculate sum of squares. The closed form n*(n-1)*(2n-1)//6
+    # would be O(1); the loop is kept because it is the workload.
+    # NumPy squares and sums in C (int64 is ample for these n)
+    if NUMPY_AVAILABLE:
+        values = np.arange(n, dtype=np.int64)
+        total = int((values * values).sum())
+    else:
+        total = sum(i * i for i in range(n))
+
+    return {
+        "input": n,
+        "result": total,
+        "duration": time.time() - start,
+        "process_id": os.getpid()
+    }
+
+
 class PerformanceComparison:
     """Compare threading vs multiprocessing performance"""
 
@@ -563,16 +899,6 @@ class PerformanceComparison:
         print("PERFORMANCE COMPARISON - I/O BOUND TASKS")
         print("=" * 60)
 
-        def io_task(task_id: int) -> dict:
-            """Simulate I/O-bound task"""
-            start = time.time()
-            time.sleep(0.5)  # Simulate I/O delay
-            return {
-                "task_id": task_id,
-                "duration": time.time() - start,
-                "process_id": os.getpid()
-            }
-
         tasks = list(range(8))
 
         print("\\n1. Sequential execution:")
@@ -583,14 +909,14 @@ class PerformanceComparison:
 
         print("\\n2. Threading execution:")
         start_time = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DEFAULT_IO_WORKERS) as executor:
             thread_results = list(executor.map(io_task, tasks))
         thread_time = time.time() - start_time
         print(f"   Time: {thread_time:.2f}s, Speedup: {sequential_time/thread_time:.2f}x")
 
         print("\\n3. Multiprocessing execution:")
         start_time = time.time()
-        with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=DEFAULT_CPU_WORKERS) as executor:
             process_results = list(executor.map(io_task, tasks))
         process_time = time.time() - start_time
         print(f"   Time: {process_time:.2f}s, Speedup: {sequential_time/process_time:.2f}x")
@@ -607,20 +933,6 @@ class PerformanceComparison:
         print("PERFORMANCE COMPARISON - CPU BOUND TASKS")
         print("=" * 60)
 
-        def cpu_task(n: int) -> dict:
-            """CPU-intensive task"""
-            start = time.time()
-
-            # Calculate sum of squares
-            total = sum(i * i for i in range(n))
-
-            return {
-                "input": n,
-                "result": total,
-                "duration": time.time() - start,
-                "process_id": os.getpid()
-            }
-
         tasks = [100000, 200000, 300000, 400000]
 
         print("\\n1. Sequential execution:")
@@ -630,22 +942,31 @@ class PerformanceComparison:
         print(f"   Time: {sequential_time:.2f}s")
 
         print("\\n2. Threading execution:")
-        start_time = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            thread_results = list(executor.map(cpu_task, tasks))
-        thread_time = time.time() - start_time
-        print(f"   Time: {thread_time:.2f}s, Speedup: {sequential_time/thread_time:.2f}x")
+        thread_time = None
+        if DEFAULT_CPU_WORKERS == 1:
+            print("   Skipped: with a single CPU there is no parallel speedup to show")
+        else:
+            start_time = time.time()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=DEFAULT_CPU_WORKERS) as executor:
+                thread_results = list(executor.map(cpu_task, tasks))
+            thread_time = time.time() - start_time
+            print(f"   Time: {thread_time:.2f}s, Speedup: {sequential_time/thread_time:.2f}x")
 
         print("\\n3. Multiprocessing execution:")
         start_time = time.time()
-        with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=DEFAULT_CPU_WORKERS,
+            initializer=pin_worker_to_cpu,
+            initargs=(multiprocessing.Value('i', 0),)
+        ) as executor:
             process_results = list(executor.map(cpu_task, tasks))
         process_time = time.time() - start_time
         print(f"   Time: {process_time:.2f}s, Speedup: {sequential_time/process_time:.2f}x")
 
         print("\\n📊 Results:")
         print(f"   Sequential: {sequential_time:.2f}s")
-        print(f"   Threading:  {thread_time:.2f}s ({sequential_time/thread_time:.1f}x)")
+        if thread_time is not None:
+            print(f"   Threading:  {thread_time:.2f}s ({sequential_time/thread_time:.1f}x)")
         print(f"   Multiproc:  {process_time:.2f}s ({sequential_time/process_time:.1f}x faster)")
         print("   💡 Multiprocessing is better for CPU-bound tasks!")
 
@@ -674,6 +995,21 @@ def threading_io_task(task_id: int) -> dict:
         "type": "threading"
     }
 
+async def mixed_task(task_id: int) -> dict:
+    """Blocking work offloaded with asyncio.to_thread, then async I/O"""
+    start = time.time()
+    if NUMPY_AVAILABLE:
+        # NumPy's FFT runs in C with the GIL released, so it overlaps too
+        await asyncio.to_thread(np.fft.fft, np.random.rand(1 << 16))
+    else:
+        await asyncio.to_thread(time.sleep, 0.1)  # Simulate a blocking call
+    await asyncio.sleep(0.1)  # Simulate async I/O
+    return {
+        "task_id": task_id,
+        "duration": time.time() - start,
+        "type": "to_thread"
+    }
+
 async def async_vs_threading_comparison():
     """Compare async/await vs threading for I/O-bound tasks"""
     print("\\n" + "=" * 60)
@@ -695,6 +1031,17 @@ async def async_vs_threading_comparison():
     thread_time = time.time() - start_time
     print(f"   Time: {thread_time:.2f}s")
 
+    print("\\n3. Blocking calls in async code (asyncio.to_thread):")
+    start_time = time.time()
+    for task_id in tasks:
+        await mixed_task(task_id)
+    serial_mixed_time = time.time() - start_time
+    start_time = time.time()
+    mixed_results = await asyncio.gather(*[mixed_task(task_id) for task_id in tasks])
+    mixed_time = time.time() - start_time
+    print(f"   One at a time: {serial_mixed_time:.2f}s, gathered: {mixed_time:.2f}s")
+    print("   (worker threads only overlap work that releases the GIL: I/O, NumPy, ...)")
+
     print("\\n📊 Comparison:")
     print(f"   Async/await: {async_time:.2f}s")
     print(f"   Threading:   {thread_time:.2f}s")
@@ -780,12 +1127,14 @@ def main():
     multiprocessing_example.basic_multiprocessing_example()
     multiprocessing_example.process_communication_example()
     multiprocessing_example.shared_memory_example()
+    multiprocessing_example.close()
 
     # Concurrent futures examples
     futures_example = ConcurrentFuturesExample()
     futures_example.thread_pool_executor_example()
     futures_example.process_pool_executor_example()
     futures_example.future_callbacks_example()
+    futures_example.close()
 
     # Performance comparisons
     perf_comparison = PerformanceComparison()
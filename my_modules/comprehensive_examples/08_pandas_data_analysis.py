@@ -148,8 +148,8 @@ class PandasBasics:
 
         # String contains
         df_with_emails = df.copy()
-        df_with_emails['Email'] = [f"{name.lower().replace(' ', '.')}@company.com"
-                                 for name in df_with_emails['Name']]
+        df_with_emails['Email'] = (df_with_emails['Name'].str.lower()
+                                   .str.replace(' ', '.', regex=False) + '@company.com')
         gmail_users = df_with_emails[df_with_emails['Email'].str.contains('gmail')]
         print(f"\\nEmails containing 'gmail': {len(gmail_users)}")
 
@@ -169,11 +169,15 @@ class DataLoadingAndCleaning:
         # Sales data
         np.random.seed(42)
         dates = pd.date_range('2023-01-01', periods=365, freq='D')
+        products = ['Laptop', 'Phone', 'Tablet', 'Watch']
+        regions = ['North', 'South', 'East', 'West']
 
+        # Low-cardinality labels are stored as categoricals: small integer
+        # codes into one shared set of strings instead of a Python object per row
         sales_data = pd.DataFrame({
             'Date': dates,
-            'Product': np.random.choice(['Laptop', 'Phone', 'Tablet', 'Watch'], 365),
-            'Region': np.random.choice(['North', 'South', 'East', 'West'], 365),
+            'Product': pd.Categorical(np.random.choice(products, 365), categories=sorted(products)),
+            'Region': pd.Categorical(np.random.choice(regions, 365), categories=sorted(regions)),
             'Sales_Amount': np.random.normal(1000, 300, 365).round(2),
             'Units_Sold': np.random.poisson(10, 365),
             'Customer_ID': np.random.randint(1000, 9999, 365)
@@ -187,12 +191,14 @@ class DataLoadingAndCleaning:
         print(f"Sample data:\\n{sales_data.head()}\\n")
 
         # Customer data
+        genders = ['M', 'F']
+        cities = ['NYC', 'LA', 'Chicago', 'Houston']
         customer_data = pd.DataFrame({
             'Customer_ID': range(1000, 2000),
-            'Name': [f'Customer_{i}' for i in range(1000)],
+            'Name': 'Customer_' + pd.RangeIndex(1000).astype(str),
             'Age': np.random.randint(18, 80, 1000),
-            'Gender': np.random.choice(['M', 'F'], 1000),
-            'City': np.random.choice(['NYC', 'LA', 'Chicago', 'Houston'], 1000),
+            'Gender': pd.Categorical(np.random.choice(genders, 1000), categories=sorted(genders)),
+            'City': pd.Categorical(np.random.choice(cities, 1000), categories=sorted(cities)),
             'Join_Date': pd.date_range('2020-01-01', periods=1000, freq='D')[:1000]
         })
 
@@ -230,32 +236,39 @@ class DataLoadingAndCleaning:
 
         # Data type conversion
         sales_data['Date'] = pd.to_datetime(sales_data['Date'])
-        sales_data['Customer_ID'] = sales_data['Customer_ID'].astype(str)
+        # Keep the ID a plain int64: integer keys hash far faster than
+        # strings when joining on them later, and both frames share the dtype
+        sales_data['Customer_ID'] = sales_data['Customer_ID'].astype('int64')
         print("\\nConverted data types:")
         print(f"Date: {sales_data['Date'].dtype}")
         print(f"Customer_ID: {sales_data['Customer_ID'].dtype}")
 
-        # Create new features
-        sales_data['Year'] = sales_data['Date'].dt.year
-        sales_data['Month'] = sales_data['Date'].dt.month
-        sales_data['DayOfWeek'] = sales_data['Date'].dt.dayofweek
+        # Create new features. The date parts are taken from one
+        # DatetimeIndex and stored, so later steps group on these columns
+        # instead of re-deriving them from Date
+        dates = pd.DatetimeIndex(sales_data['Date'])
+        sales_data['Year'] = dates.year
+        sales_data['Month'] = dates.month
+        sales_data['DayOfWeek'] = dates.dayofweek
+        sales_data['Period_M'] = dates.to_period('M')
         sales_data['Revenue'] = sales_data['Sales_Amount'] * sales_data['Units_Sold']
 
-        print("\\nNew features created: Year, Month, DayOfWeek, Revenue")
+        print("\\nNew features created: Year, Month, DayOfWeek, Period_M, Revenue")
 
-        # Outlier detection and handling
-        Q1 = sales_data['Sales_Amount'].quantile(0.25)
-        Q3 = sales_data['Sales_Amount'].quantile(0.75)
+        # Outlier detection and handling, on the raw NumPy array: comparisons
+        # and clipping skip pandas' index alignment and Series wrapping
+        sales_amount = sales_data['Sales_Amount'].to_numpy()
+        Q1, Q3 = np.quantile(sales_amount, [0.25, 0.75])
         IQR = Q3 - Q1
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
 
-        outliers = sales_data[(sales_data['Sales_Amount'] < lower_bound) |
-                            (sales_data['Sales_Amount'] > upper_bound)]
+        outlier_mask = (sales_amount < lower_bound) | (sales_amount > upper_bound)
+        outliers = sales_data.iloc[np.flatnonzero(outlier_mask)]
         print(f"\\nOutliers detected: {len(outliers)} ({len(outliers)/len(sales_data)*100:.1f}%)")
 
         # Cap outliers instead of removing them
-        sales_data['Sales_Amount'] = sales_data['Sales_Amount'].clip(lower_bound, upper_bound)
+        sales_data['Sales_Amount'] = np.clip(sales_amount, lower_bound, upper_bound)
         print("Outliers capped to reasonable bounds")
 
         return sales_data
@@ -273,46 +286,47 @@ class DataManipulationAndTransformation:
         print("\\n1. GROUPBY OPERATIONS")
         print("-" * 40)
 
+        # Group once by every key used below; the summaries are rolled up
+        # from these small partial sums instead of re-hashing the data.
+        # observed=True skips empty key combinations and sort=False leaves
+        # the ordering to the (much smaller) roll-ups
+        partials = sales_data.groupby(['Product', 'Region', 'Period_M'], observed=True, sort=False).agg(
+            Transaction_Count=('Sales_Amount', 'count'),
+            Total_Sales=('Sales_Amount', 'sum'),
+            Total_Units=('Units_Sold', 'sum'),
+            Total_Revenue=('Revenue', 'sum')
+        )
+
         # Basic groupby
         print("\\nBasic GroupBy Operations:")
-        product_summary = sales_data.groupby('Product').agg({
-            'Sales_Amount': ['count', 'sum', 'mean'],
-            'Units_Sold': 'sum',
-            'Revenue': 'sum'
-        }).round(2)
-
-        # Flatten column names
-        product_summary.columns = ['_'.join(col).strip() for col in product_summary.columns]
-        product_summary = product_summary.rename(columns={
-            'Sales_Amount_count': 'Transaction_Count',
-            'Sales_Amount_sum': 'Total_Sales',
-            'Sales_Amount_mean': 'Avg_Sales',
-            'Units_Sold_sum': 'Total_Units',
-            'Revenue_sum': 'Total_Revenue'
-        })
+        product_summary = partials.groupby(level='Product', observed=True).sum()
+        product_summary.insert(2, 'Avg_Sales',
+                               product_summary['Total_Sales'] / product_summary['Transaction_Count'])
+        product_summary = product_summary.round(2)
 
         print(f"Product Summary:\\n{product_summary}")
 
         # Multiple grouping
         print("\\n\\nMultiple Grouping (Product + Region):")
-        region_product = sales_data.groupby(['Product', 'Region'])['Revenue'].sum().unstack(fill_value=0)
+        region_product = (partials['Total_Revenue']
+                          .groupby(level=['Product', 'Region'], observed=True).sum()
+                          .unstack(fill_value=0))
         print(f"Revenue by Product and Region:\\n{region_product}")
 
         # Time-based grouping
         print("\\n\\nTime-based Grouping:")
-        monthly_sales = sales_data.groupby([sales_data['Date'].dt.to_period('M')])['Revenue'].sum()
+        monthly_sales = (partials['Total_Revenue']
+                         .groupby(level='Period_M').sum())
         print(f"Monthly sales (first 6 months):\\n{monthly_sales.head(6)}")
 
-        # Custom aggregation
-        def revenue_stats(x):
-            return pd.Series({
-                'min_revenue': x.min(),
-                'max_revenue': x.max(),
-                'avg_revenue': x.mean(),
-                'std_revenue': x.std()
-            })
-
-        custom_agg = sales_data.groupby('Region')['Revenue'].apply(revenue_stats).round(2)
+        # Custom aggregation: named aggregations run pandas' built-in
+        # reducers for every group, with no Python call (or Series) per group
+        custom_agg = sales_data.groupby('Region', observed=True)['Revenue'].agg(
+            min_revenue='min',
+            max_revenue='max',
+            avg_revenue='mean',
+            std_revenue='std'
+        ).round(2)
         print(f"\\nCustom aggregation by Region:\\n{custom_agg}")
 
         return product_summary
@@ -322,18 +336,19 @@ class DataManipulationAndTransformation:
         print("\\n2. DATA MERGING AND JOINING")
         print("-" * 40)
 
-        # Convert Customer_ID to string for proper joining
-        customer_data['Customer_ID'] = customer_data['Customer_ID'].astype(str)
+        # Index the customers by their int64 ID, so each join looks sales
+        # keys up in that index instead of hashing both sides
+        customers = customer_data.set_index('Customer_ID')
 
         # Inner join
         print("\\nInner Join (sales with customer data):")
-        merged_inner = pd.merge(sales_data, customer_data, on='Customer_ID', how='inner')
+        merged_inner = sales_data.join(customers, on='Customer_ID', how='inner')
         print(f"Inner join result: {merged_inner.shape}")
         print(f"Sample merged data:\\n{merged_inner[['Date', 'Product', 'Name', 'Age', 'City']].head(3)}")
 
         # Left join
         print("\\nLeft Join (all sales records):")
-        merged_left = pd.merge(sales_data, customer_data, on='Customer_ID', how='left')
+        merged_left = sales_data.join(customers, on='Customer_ID', how='left')
         print(f"Left join result: {merged_left.shape}")
         missing_customers = merged_left['Name'].isnull().sum()
         print(f"Sales records without customer data: {missing_customers}")
@@ -359,7 +374,8 @@ class DataManipulationAndTransformation:
             index='Product',
             columns='Region',
             aggfunc='sum',
-            fill_value=0
+            fill_value=0,
+            observed=True
         ).round(0)
         print(f"Revenue by Product and Region:\\n{pivot_basic}")
 
@@ -370,7 +386,8 @@ class DataManipulationAndTransformation:
             index='Product',
             columns='Region',
             aggfunc={'Revenue': 'sum', 'Units_Sold': 'mean'},
-            fill_value=0
+            fill_value=0,
+            observed=True
         ).round(2)
         print(f"Multi-metric pivot (showing first 2 products):\\n{pivot_multi.head(2)}")
 
@@ -381,7 +398,8 @@ class DataManipulationAndTransformation:
             index='Product',
             columns='Month_Name',
             aggfunc='sum',
-            fill_value=0
+            fill_value=0,
+            observed=True
         ).round(0)
         print(f"\\nMonthly Revenue Pivot (first 3 months):")
         print(monthly_pivot.iloc[:, :3])
@@ -429,9 +447,13 @@ class AdvancedDataAnalysis:
         print("\\n2. TIME SERIES ANALYSIS")
         print("-" * 40)
 
-        # Daily time series
-        daily_sales = sales_data.groupby('Date')['Revenue'].sum().reset_index()
-        daily_sales.set_index('Date', inplace=True)
+        # Daily time series; the precomputed calendar columns ride along
+        # for the seasonality breakdown below
+        daily_sales = sales_data.groupby('Date').agg(
+            Revenue=('Revenue', 'sum'),
+            DayOfWeek=('DayOfWeek', 'first'),
+            Month=('Month', 'first')
+        )
 
         print("\\nDaily Sales Time Series:")
         print(f"Period: {daily_sales.index.min()} to {daily_sales.index.max()}")
@@ -456,9 +478,6 @@ class AdvancedDataAnalysis:
         print(f"  Trend change: {trend_change:+.1f}%")
 
         # Seasonality
-        daily_sales['DayOfWeek'] = daily_sales.index.dayofweek
-        daily_sales['Month'] = daily_sales.index.month
-
         weekly_pattern = daily_sales.groupby('DayOfWeek')['Revenue'].mean()
         monthly_pattern = daily_sales.groupby('Month')['Revenue'].mean()
 
@@ -476,8 +495,8 @@ class AdvancedDataAnalysis:
 
         # Prepare cohort data
         cohort_data = merged_data.copy()
-        cohort_data['Order_Period'] = cohort_data['Date'].dt.to_period('M')
-        cohort_data['Cohort_Group'] = cohort_data.groupby('Customer_ID')['Date'].transform('min').dt.to_period('M')
+        cohort_data['Order_Period'] = cohort_data['Period_M']
+        cohort_data['Cohort_Group'] = cohort_data.groupby('Customer_ID')['Period_M'].transform('min')
 
         # Calculate period number
         def get_date_int(df, column):
@@ -562,11 +581,12 @@ class BigDataHandling:
 
         print(f"Creating large CSV file: {large_file}")
         n_rows = 50000
+        categories = ['Food', 'Transport', 'Shopping', 'Entertainment']
         chunk_data = pd.DataFrame({
             'transaction_id': range(n_rows),
             'customer_id': np.random.randint(1000, 9999, n_rows),
             'amount': np.random.exponential(100, n_rows).round(2),
-            'category': np.random.choice(['Food', 'Transport', 'Shopping', 'Entertainment'], n_rows),
+            'category': np.random.choice(categories, n_rows),
             'date': pd.date_range('2023-01-01', periods=n_rows, freq='min')
         })
         chunk_data.to_csv(large_file, index=False)
@@ -578,7 +598,11 @@ class BigDataHandling:
         category_counts = {}
         chunk_count = 0
 
-        for chunk in pd.read_csv(large_file, chunksize=chunk_size):
+        # Parse the category column straight into categorical codes, so each
+        # chunk never holds a Python string per row
+        category_dtype = pd.CategoricalDtype(categories)
+        for chunk in pd.read_csv(large_file, chunksize=chunk_size,
+                                 dtype={'category': category_dtype}):
             chunk_count += 1
 
             # Process each chunk
@@ -610,7 +634,7 @@ class BigDataHandling:
         df = pd.DataFrame({
             'A': np.random.randn(100000),
             'B': np.random.randn(100000),
-            'C': np.random.choice(['X', 'Y', 'Z'], 100000),
+            'C': pd.Categorical(np.random.choice(['X', 'Y', 'Z'], 100000), categories=['X', 'Y', 'Z']),
             'D': pd.date_range('2023-01-01', periods=100000, freq='min')
         })
 
@@ -682,7 +706,7 @@ class DataVisualizationWithPandas:
         fig.suptitle('Sales Data Analysis Dashboard', fontsize=16)
 
         # 1. Revenue by Product (Bar plot)
-        product_revenue = sales_data.groupby('Product')['Revenue'].sum().sort_values(ascending=False)
+        product_revenue = sales_data.groupby('Product', observed=True)['Revenue'].sum().sort_values(ascending=False)
         product_revenue.plot(kind='bar', ax=axes[0,0], color='skyblue')
         axes[0,0].set_title('Total Revenue by Product')
         axes[0,0].set_ylabel('Revenue ($)')
@@ -701,7 +725,7 @@ class DataVisualizationWithPandas:
         axes[1,0].set_ylabel('Frequency')
 
         # 4. Revenue by Region (Pie chart)
-        region_revenue = sales_data.groupby('Region')['Revenue'].sum()
+        region_revenue = sales_data.groupby('Region', observed=True)['Revenue'].sum()
         region_revenue.plot(kind='pie', ax=axes[1,1], autopct='%1.1f%%', startangle=90)
         axes[1,1].set_title('Revenue by Region')
         axes[1,1].set_ylabel('')  # Remove ylabel for pie chart
@@ -754,7 +778,7 @@ class DataVisualizationWithPandas:
                                     ha="center", va="center", color="black" if abs(correlation.iloc[i, j]) < 0.5 else "white")
 
         # 4. Monthly revenue trend with moving average
-        monthly_data = merged_data.groupby(merged_data['Date'].dt.to_period('M'))['Revenue'].sum()
+        monthly_data = merged_data.groupby('Period_M')['Revenue'].sum()
         monthly_data.plot(kind='line', ax=axes[1,1], marker='o', linewidth=2, markersize=4)
 
         # Add moving average